@@ -56,8 +56,9 @@ def validate(test_file, variable, year, tolerance, no_policyengine, no_taxsim, c
             test_data = json.load(f)
     elif test_path.suffix in [".yaml", ".yml"]:
         import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(test_path) as f:
-            test_data = yaml.safe_load(f)
+            test_data = yaml.load(f, Loader=loader)
     else:
         raise click.ClickException(f"Unsupported file format: {test_path.suffix}")
 
@@ -1,34 +1,38 @@
-"""Record-by-record Cosilico vs PolicyEngine comparison."""
-
-from .core import (
-    compare_records,
-    generate_dashboard_json,
-    load_cosilico_values,
-    load_pe_values,
-    run_full_comparison,
-    run_variable_comparison,
-)
-
-from .aligned import (
-    CommonDataset,
-    ComparisonResult,
-    load_common_dataset,
-    compare_variable,
-    run_aligned_comparison,
-)
-
-__all__ = [
+"""Record-by-record Cosilico vs PolicyEngine comparison.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package does not pull in PolicyEngine until a comparison is used.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
     # Core comparison
-    "compare_records",
-    "load_pe_values",
-    "load_cosilico_values",
-    "run_variable_comparison",
-    "run_full_comparison",
-    "generate_dashboard_json",
+    "compare_records": ".core",
+    "load_pe_values": ".core",
+    "load_cosilico_values": ".core",
+    "run_variable_comparison": ".core",
+    "run_full_comparison": ".core",
+    "generate_dashboard_json": ".core",
     # Aligned comparison (common dataset)
-    "CommonDataset",
-    "ComparisonResult",
-    "load_common_dataset",
-    "compare_variable",
-    "run_aligned_comparison",
-]
+    "CommonDataset": ".aligned",
+    "ComparisonResult": ".aligned",
+    "load_common_dataset": ".aligned",
+    "compare_variable": ".aligned",
+    "run_aligned_comparison": ".aligned",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
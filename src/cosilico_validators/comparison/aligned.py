@@ -3,7 +3,7 @@
 Uses PolicyEngine's input data for both systems to isolate rule differences.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable
 import numpy as np
 
@@ -77,24 +77,53 @@ class CommonDataset:
     student_loan_interest_deduction: np.ndarray  # §62(a)(17) - up to $2,500
     above_the_line_deductions_total: np.ndarray  # Total ALDs from PolicyEngine
 
+    # Scratch space reused by compare_variable across variables
+    _diff_scratch: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    _match_scratch: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def n_records(self) -> int:
         return len(self.tax_unit_id)
 
+    def comparison_buffers(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return float64 diff and bool match buffers of length n.
+
+        Allocated once (at least n_records long) and sliced on later calls.
+        """
+        if self._diff_scratch is None or len(self._diff_scratch) < n:
+            size = max(n, self.n_records)
+            self._diff_scratch = np.empty(size, dtype=np.float64)
+            self._match_scratch = np.empty(size, dtype=bool)
+        return self._diff_scratch[:n], self._match_scratch[:n]
+
 
-def load_common_dataset(year: int = 2024) -> CommonDataset:
+def load_common_dataset(
+    year: int = 2024,
+    sim=None,
+    calculated: dict[str, np.ndarray] | None = None,
+) -> CommonDataset:
     """Load common dataset from PolicyEngine simulation.
 
     Extracts all input variables needed for tax calculations from PE's
     enhanced CPS, providing a shared baseline for comparison.
+
+    Pass an existing ``sim`` to reuse it (and its calculated variables)
+    instead of building a second Microsimulation. ``calculated`` is a
+    variable -> array memo; pass the caller's own memo for that ``sim`` to
+    have the arrays fetched here reused (and vice versa).
     """
-    if not HAS_POLICYENGINE:
-        raise ImportError("policyengine_us required for common dataset")
+    if sim is None:
+        if not HAS_POLICYENGINE:
+            raise ImportError("policyengine_us required for common dataset")
+        sim = Microsimulation()
 
-    sim = Microsimulation()
+    if calculated is None:
+        calculated = {}
 
     def calc(var):
-        return np.array(sim.calculate(var, year))
+        if var not in calculated:
+            calculated[var] = np.array(sim.calculate(var, year))
+        return calculated[var]
 
     # Get tax_unit-level arrays first
     tax_unit_id = calc("tax_unit_id")
@@ -115,35 +144,45 @@ def load_common_dataset(year: int = 2024) -> CommonDataset:
     is_tax_unit_spouse = calc("is_tax_unit_spouse")
     person_tax_unit_id = calc("person_tax_unit_id")
 
-    # Create mapping from tax_unit_id to index
-    tu_id_to_idx = {tid: idx for idx, tid in enumerate(tax_unit_id)}
+    # Map each person to their tax unit's index (vectorized lookup of
+    # person_tax_unit_id in tax_unit_id; unknown IDs are flagged)
+    tu_order = np.argsort(tax_unit_id, kind="stable")
+    sorted_tu_ids = tax_unit_id[tu_order]
+    pos = np.searchsorted(sorted_tu_ids, person_tax_unit_id).clip(max=n_tax_units - 1)
+    person_in_tu = sorted_tu_ids[pos] == person_tax_unit_id
+    person_tu_idx = np.where(person_in_tu, tu_order[pos], 0)
 
     # Helper to aggregate Person-level values to TaxUnit level
     def aggregate_to_tax_unit(person_values: np.ndarray) -> np.ndarray:
         """Sum Person-level values by tax unit."""
-        # Map each person's tax_unit_id to an index
-        person_tu_idx = np.array([tu_id_to_idx.get(ptu_id, 0) for ptu_id in person_tax_unit_id])
-        # Sum by tax unit
         return np.bincount(person_tu_idx, weights=person_values.astype(float), minlength=n_tax_units)
 
-    # Initialize tax_unit-level blind arrays
+    def calc_optional(var, aggregate=False, default=None):
+        """calc() for variables that may not exist in this PE version.
+
+        Falls back to ``calc(default)`` or zeros. A single calculate() call
+        both probes and fetches the variable.
+        """
+        try:
+            values = calc(var)
+        except Exception:
+            if default is not None:
+                return calc(default)
+            return np.zeros_like(tax_unit_id, dtype=float)
+        return aggregate_to_tax_unit(values) if aggregate else values
+
+    # Aggregate person-level blind/dependent flags to tax_unit level
+    is_tax_unit_dependent = calc("is_tax_unit_dependent")
+    is_blind_person = is_blind_person.astype(bool, copy=False)
+    is_head = person_in_tu & is_tax_unit_head.astype(bool, copy=False)
+    is_spouse = person_in_tu & is_tax_unit_spouse.astype(bool, copy=False)
+
     head_is_blind = np.zeros(n_tax_units, dtype=bool)
     spouse_is_blind = np.zeros(n_tax_units, dtype=bool)
     head_is_dependent = np.zeros(n_tax_units, dtype=bool)
-
-    # Aggregate person-level to tax_unit-level
-    is_tax_unit_dependent = calc("is_tax_unit_dependent")
-    for i in range(len(person_tax_unit_id)):
-        ptu_id = person_tax_unit_id[i]
-        if ptu_id in tu_id_to_idx:
-            tu_idx = tu_id_to_idx[ptu_id]
-            if is_tax_unit_head[i]:
-                if is_blind_person[i]:
-                    head_is_blind[tu_idx] = True
-                if is_tax_unit_dependent[i]:
-                    head_is_dependent[tu_idx] = True
-            if is_tax_unit_spouse[i] and is_blind_person[i]:
-                spouse_is_blind[tu_idx] = True
+    head_is_blind[person_tu_idx[is_head & is_blind_person]] = True
+    head_is_dependent[person_tu_idx[is_head & is_tax_unit_dependent.astype(bool, copy=False)]] = True
+    spouse_is_blind[person_tu_idx[is_spouse & is_blind_person]] = True
 
     return CommonDataset(
         tax_unit_id=tax_unit_id,
@@ -154,19 +193,19 @@ def load_common_dataset(year: int = 2024) -> CommonDataset:
         # Income (aligned with PE's irs_gross_income sources)
         earned_income=calc("tax_unit_earned_income"),
         wages=aggregate_to_tax_unit(calc("irs_employment_income")),  # W-2 income only
-        self_employment_income=aggregate_to_tax_unit(calc("self_employment_income")) if _var_exists(sim, "self_employment_income", year) else np.zeros_like(tax_unit_id, dtype=float),
-        partnership_s_corp_income=calc("tax_unit_partnership_s_corp_income") if _var_exists(sim, "tax_unit_partnership_s_corp_income", year) else np.zeros_like(tax_unit_id, dtype=float),
-        farm_income=aggregate_to_tax_unit(calc("farm_income")) if _var_exists(sim, "farm_income", year) else np.zeros_like(tax_unit_id, dtype=float),
+        self_employment_income=calc_optional("self_employment_income", aggregate=True),
+        partnership_s_corp_income=calc_optional("tax_unit_partnership_s_corp_income"),
+        farm_income=calc_optional("farm_income", aggregate=True),
         # Aggregate Person-level income to TaxUnit level
-        interest_income=aggregate_to_tax_unit(calc("taxable_interest_income")) if _var_exists(sim, "taxable_interest_income", year) else np.zeros_like(tax_unit_id, dtype=float),
-        dividend_income=aggregate_to_tax_unit(calc("dividend_income")) if _var_exists(sim, "dividend_income", year) else np.zeros_like(tax_unit_id, dtype=float),
-        capital_gains=aggregate_to_tax_unit(calc("capital_gains")) if _var_exists(sim, "capital_gains", year) else np.zeros_like(tax_unit_id, dtype=float),
-        rental_income=aggregate_to_tax_unit(calc("rental_income")) if _var_exists(sim, "rental_income", year) else np.zeros_like(tax_unit_id, dtype=float),
-        taxable_social_security=calc("tax_unit_taxable_social_security") if _var_exists(sim, "tax_unit_taxable_social_security", year) else np.zeros_like(tax_unit_id, dtype=float),
-        pension_income=aggregate_to_tax_unit(calc("taxable_pension_income")) if _var_exists(sim, "taxable_pension_income", year) else np.zeros_like(tax_unit_id, dtype=float),
-        taxable_unemployment=aggregate_to_tax_unit(calc("taxable_unemployment_compensation")) if _var_exists(sim, "taxable_unemployment_compensation", year) else np.zeros_like(tax_unit_id, dtype=float),
-        retirement_distributions=aggregate_to_tax_unit(calc("taxable_retirement_distributions")) if _var_exists(sim, "taxable_retirement_distributions", year) else np.zeros_like(tax_unit_id, dtype=float),
-        miscellaneous_income=aggregate_to_tax_unit(calc("miscellaneous_income")) if _var_exists(sim, "miscellaneous_income", year) else np.zeros_like(tax_unit_id, dtype=float),
+        interest_income=calc_optional("taxable_interest_income", aggregate=True),
+        dividend_income=calc_optional("dividend_income", aggregate=True),
+        capital_gains=calc_optional("capital_gains", aggregate=True),
+        rental_income=calc_optional("rental_income", aggregate=True),
+        taxable_social_security=calc_optional("tax_unit_taxable_social_security"),
+        pension_income=calc_optional("taxable_pension_income", aggregate=True),
+        taxable_unemployment=calc_optional("taxable_unemployment_compensation", aggregate=True),
+        retirement_distributions=calc_optional("taxable_retirement_distributions", aggregate=True),
+        miscellaneous_income=calc_optional("miscellaneous_income", aggregate=True),
         other_income=np.zeros_like(tax_unit_id, dtype=float),
 
         investment_income=calc("net_investment_income"),
@@ -177,7 +216,7 @@ def load_common_dataset(year: int = 2024) -> CommonDataset:
 
         # Demographics
         eitc_child_count=calc("eitc_child_count"),
-        ctc_child_count=calc("ctc_qualifying_children") if _var_exists(sim, "ctc_qualifying_children", year) else calc("eitc_child_count"),
+        ctc_child_count=calc_optional("ctc_qualifying_children", default="eitc_child_count"),
         head_age=head_age,
         spouse_age=spouse_age,
 
@@ -187,32 +226,23 @@ def load_common_dataset(year: int = 2024) -> CommonDataset:
         head_is_dependent=head_is_dependent,
 
         # CDCC inputs (from 26 USC 21)
-        cdcc_qualifying_individuals=calc("capped_count_cdcc_eligible") if _var_exists(sim, "capped_count_cdcc_eligible", year) else np.zeros_like(tax_unit_id, dtype=float),
-        childcare_expenses=calc("tax_unit_childcare_expenses") if _var_exists(sim, "tax_unit_childcare_expenses", year) else np.zeros_like(tax_unit_id, dtype=float),
+        cdcc_qualifying_individuals=calc_optional("capped_count_cdcc_eligible"),
+        childcare_expenses=calc_optional("tax_unit_childcare_expenses"),
 
         # Above-the-line deductions (from 26 USC 62)
-        self_employment_tax_deduction=calc("self_employment_tax_ald") if _var_exists(sim, "self_employment_tax_ald", year) else np.zeros_like(tax_unit_id, dtype=float),
-        self_employed_health_insurance_deduction=calc("self_employed_health_insurance_ald") if _var_exists(sim, "self_employed_health_insurance_ald", year) else np.zeros_like(tax_unit_id, dtype=float),
-        educator_expense_deduction=aggregate_to_tax_unit(calc("educator_expense")) if _var_exists(sim, "educator_expense", year) else np.zeros_like(tax_unit_id, dtype=float),
-        loss_deduction=calc("loss_ald") if _var_exists(sim, "loss_ald", year) else np.zeros_like(tax_unit_id, dtype=float),
-        self_employed_pension_deduction=calc("self_employed_pension_contribution_ald") if _var_exists(sim, "self_employed_pension_contribution_ald", year) else np.zeros_like(tax_unit_id, dtype=float),
-        ira_deduction=aggregate_to_tax_unit(calc("traditional_ira_contributions")) if _var_exists(sim, "traditional_ira_contributions", year) else np.zeros_like(tax_unit_id, dtype=float),
-        hsa_deduction=calc("health_savings_account_ald") if _var_exists(sim, "health_savings_account_ald", year) else np.zeros_like(tax_unit_id, dtype=float),
+        self_employment_tax_deduction=calc_optional("self_employment_tax_ald"),
+        self_employed_health_insurance_deduction=calc_optional("self_employed_health_insurance_ald"),
+        educator_expense_deduction=calc_optional("educator_expense", aggregate=True),
+        loss_deduction=calc_optional("loss_ald"),
+        self_employed_pension_deduction=calc_optional("self_employed_pension_contribution_ald"),
+        ira_deduction=calc_optional("traditional_ira_contributions", aggregate=True),
+        hsa_deduction=calc_optional("health_savings_account_ald"),
         # student_loan_interest_ald is Person-level, needs aggregation
-        student_loan_interest_deduction=aggregate_to_tax_unit(calc("student_loan_interest_ald")) if _var_exists(sim, "student_loan_interest_ald", year) else np.zeros_like(tax_unit_id, dtype=float),
-        above_the_line_deductions_total=calc("above_the_line_deductions") if _var_exists(sim, "above_the_line_deductions", year) else np.zeros_like(tax_unit_id, dtype=float),
+        student_loan_interest_deduction=calc_optional("student_loan_interest_ald", aggregate=True),
+        above_the_line_deductions_total=calc_optional("above_the_line_deductions"),
     )
 
 
-def _var_exists(sim, var_name: str, year: int) -> bool:
-    """Check if a variable exists and has values."""
-    try:
-        sim.calculate(var_name, year)
-        return True
-    except:
-        return False
-
-
 @dataclass
 class ComparisonResult:
     """Result of comparing a single variable."""
@@ -222,8 +252,8 @@ class ComparisonResult:
     n_records: int
     cosilico_total: float  # Weighted
     policyengine_total: float  # Weighted
-    cosilico_values: np.ndarray
-    policyengine_values: np.ndarray
+    cosilico_values: np.ndarray | None  # None unless compare_variable(retain_values=True)
+    policyengine_values: np.ndarray | None
     error_percentiles: dict
 
 
@@ -233,14 +263,29 @@ def compare_variable(
     pe_values: np.ndarray,
     variable_name: str,
     tolerance: float = 1.0,
+    retain_values: bool = True,
 ) -> ComparisonResult:
-    """Compare Cosilico calculation to PolicyEngine on common dataset."""
+    """Compare Cosilico calculation to PolicyEngine on common dataset.
+
+    Pass ``retain_values=False`` when only the summary metrics are needed,
+    so sweeps over many variables don't keep every per-record array alive.
+    """
 
     cos_values = cosilico_func(dataset)
 
-    diff = np.abs(cos_values - pe_values)
-    match_rate = (diff <= tolerance).mean()
+    # In-place subtract/abs into the dataset's reusable scratch buffers.
+    # (float32 would lose cents on incomes in the millions, breaking the $1 tolerance.)
+    diff, matches = dataset.comparison_buffers(len(cos_values))
+    np.subtract(cos_values, pe_values, out=diff)
+    np.abs(diff, out=diff)
+    np.less_equal(diff, tolerance, out=matches)
+    match_rate = np.count_nonzero(matches) / len(diff)
     mae = diff.mean()
+    # One partition pass for all percentiles; the 100th percentile is the max.
+    # diff is scratch, so let percentile partition it in place.
+    p50, p90, p95, p99, max_diff = np.percentile(
+        diff, [50, 90, 95, 99, 100], overwrite_input=True
+    ).tolist()
 
     return ComparisonResult(
         variable=variable_name,
@@ -249,14 +294,14 @@ def compare_variable(
         n_records=len(cos_values),
         cosilico_total=float((cos_values * dataset.weight).sum()),
         policyengine_total=float((pe_values * dataset.weight).sum()),
-        cosilico_values=cos_values,
-        policyengine_values=pe_values,
+        cosilico_values=cos_values if retain_values else None,
+        policyengine_values=pe_values if retain_values else None,
         error_percentiles={
-            "p50": float(np.percentile(diff, 50)),
-            "p90": float(np.percentile(diff, 90)),
-            "p95": float(np.percentile(diff, 95)),
-            "p99": float(np.percentile(diff, 99)),
-            "max": float(diff.max()),
+            "p50": p50,
+            "p90": p90,
+            "p95": p95,
+            "p99": p99,
+            "max": max_diff,
         },
     )
 
@@ -270,9 +315,12 @@ def run_aligned_comparison(year: int = 2024) -> dict:
     from pathlib import Path
     from datetime import datetime
 
-    # Load common dataset
+    # Load common dataset (its simulation is reused for PE values below)
     print("Loading common dataset from PolicyEngine...")
-    dataset = load_common_dataset(year)
+    if not HAS_POLICYENGINE:
+        raise ImportError("policyengine_us required for common dataset")
+    sim = Microsimulation()
+    dataset = load_common_dataset(year, sim=sim)
     print(f"  {dataset.n_records:,} tax units loaded")
 
     # Load Cosilico implementations
@@ -282,7 +330,6 @@ def run_aligned_comparison(year: int = 2024) -> dict:
     import pandas as pd
 
     # Get PE values
-    sim = Microsimulation()
     pe_eitc = np.array(sim.calculate("eitc", year))
     pe_income_tax = np.array(sim.calculate("income_tax_before_credits", year))
 
@@ -308,13 +355,15 @@ def run_aligned_comparison(year: int = 2024) -> dict:
     results = []
 
     print("\nComparing EITC...")
-    eitc_result = compare_variable(dataset, cos_eitc, pe_eitc, "eitc")
+    eitc_result = compare_variable(dataset, cos_eitc, pe_eitc, "eitc", retain_values=False)
     results.append(eitc_result)
     print(f"  Match rate: {eitc_result.match_rate*100:.1f}%")
     print(f"  MAE: ${eitc_result.mean_absolute_error:,.0f}")
 
     print("\nComparing Income Tax...")
-    tax_result = compare_variable(dataset, cos_income_tax, pe_income_tax, "income_tax_before_credits")
+    tax_result = compare_variable(
+        dataset, cos_income_tax, pe_income_tax, "income_tax_before_credits", retain_values=False
+    )
     results.append(tax_result)
     print(f"  Match rate: {tax_result.match_rate*100:.1f}%")
     print(f"  MAE: ${tax_result.mean_absolute_error:,.0f}")
@@ -1,5 +1,7 @@
 """Core record-by-record comparison logic."""
 
+import functools
+import logging
 from datetime import datetime
 from typing import Any
 
@@ -14,6 +16,43 @@ except ImportError:
     HAS_POLICYENGINE = False
     Microsimulation = None
 
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    numba = None
+
+logger = logging.getLogger(__name__)
+
+
+if HAS_NUMBA:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _abs_error_kernel(cos, pe, out, tol):
+        """Fill ``out`` with |cos - pe| in one pass.
+
+        Returns (number of records within tol, sum of absolute errors).
+        """
+        n_matches = 0
+        total = 0.0
+        for i in numba.prange(out.shape[0]):
+            d = abs(cos[i] - pe[i])
+            out[i] = d
+            total += d
+            if d <= tol:
+                n_matches += 1
+        return n_matches, total
+
+else:
+
+    def _abs_error_kernel(cos, pe, out, tol):
+        """NumPy fallback for the fused abs-error kernel (numba not installed)."""
+        np.subtract(cos, pe, out=out)
+        np.abs(out, out=out)
+        return int(np.count_nonzero(out <= tol)), float(out.sum())
+
 
 def compare_records(
     cosilico_values: np.ndarray,
@@ -35,38 +74,60 @@ def compare_records(
     assert len(cosilico_values) == len(pe_values), "Arrays must have same length"
 
     n_records = len(cosilico_values)
-    abs_errors = np.abs(cosilico_values - pe_values)
+    if n_records == 0:
+        return {
+            "n_records": 0,
+            "n_matches": 0,
+            "n_mismatches": 0,
+            "match_rate": 0.0,
+            "mean_absolute_error": 0.0,
+            "error_percentiles": dict.fromkeys(("p50", "p90", "p95", "p99", "max"), 0.0),
+            "worst_mismatches": [],
+            "tolerance": tolerance,
+        }
+
+    # Kept in float64: incomes run into the millions against a $1 tolerance
+    abs_errors = np.empty(n_records, dtype=np.float64)
+    n_matches, abs_error_sum = _abs_error_kernel(
+        np.asarray(cosilico_values, dtype=np.float64),
+        np.asarray(pe_values, dtype=np.float64),
+        abs_errors,
+        tolerance,
+    )
 
     # Match rate
-    matches = abs_errors <= tolerance
-    n_matches = int(np.sum(matches))
+    n_matches = int(n_matches)
     n_mismatches = n_records - n_matches
-    match_rate = n_matches / n_records if n_records > 0 else 0.0
+    match_rate = n_matches / n_records
 
     # Error stats
-    mean_absolute_error = float(np.mean(abs_errors))
-    max_error = float(np.max(abs_errors))
+    mean_absolute_error = float(abs_error_sum) / n_records
 
-    # Error percentiles
+    # Error percentiles (one partition pass; the 100th percentile is the max)
+    p50, p90, p95, p99, max_error = np.percentile(abs_errors, [50, 90, 95, 99, 100]).tolist()
     error_percentiles = {
-        "p50": float(np.percentile(abs_errors, 50)),
-        "p90": float(np.percentile(abs_errors, 90)),
-        "p95": float(np.percentile(abs_errors, 95)),
-        "p99": float(np.percentile(abs_errors, 99)),
+        "p50": p50,
+        "p90": p90,
+        "p95": p95,
+        "p99": p99,
         "max": max_error,
     }
 
-    # Worst mismatches
-    worst_indices = np.argsort(abs_errors)[-top_n_mismatches:][::-1]
-    worst_mismatches = []
-    for idx in worst_indices:
-        if abs_errors[idx] > tolerance:
-            worst_mismatches.append({
-                "index": int(idx),
-                "cosilico": float(cosilico_values[idx]),
-                "policyengine": float(pe_values[idx]),
-                "difference": float(abs_errors[idx]),
-            })
+    # Worst mismatches (skip the sort entirely when everything matched)
+    if n_mismatches:
+        worst_indices = np.argsort(abs_errors)[-top_n_mismatches:][::-1]
+        worst_indices = worst_indices[abs_errors[worst_indices] > tolerance]
+    else:
+        worst_indices = np.empty(0, dtype=np.intp)
+    worst_mismatches = [
+        {"index": idx, "cosilico": cos, "policyengine": pe, "difference": err}
+        for idx, cos, pe, err in zip(
+            worst_indices.tolist(),
+            np.asarray(cosilico_values[worst_indices], dtype=float).tolist(),
+            np.asarray(pe_values[worst_indices], dtype=float).tolist(),
+            abs_errors[worst_indices].astype(float).tolist(),
+        )
+    ]
 
     return {
         "n_records": n_records,
@@ -80,13 +141,14 @@ def compare_records(
     }
 
 
-def load_pe_values(variable: str, year: int = 2024, return_ids: bool = False):
+def load_pe_values(variable: str, year: int = 2024, return_ids: bool = False, sim=None):
     """Load PolicyEngine values for a variable across CPS.
 
     Args:
         variable: PolicyEngine variable name
         year: Tax year
         return_ids: If True, return (values, tax_unit_ids) tuple
+        sim: Microsimulation to reuse (default: build one)
 
     Returns:
         Array of values for each tax unit, or (values, ids) tuple
@@ -94,7 +156,8 @@ def load_pe_values(variable: str, year: int = 2024, return_ids: bool = False):
     if not HAS_POLICYENGINE:
         raise ImportError("policyengine_us not installed")
 
-    sim = Microsimulation()
+    if sim is None:
+        sim = Microsimulation()
     values = np.array(sim.calculate(variable, year))
 
     if return_ids:
@@ -103,22 +166,14 @@ def load_pe_values(variable: str, year: int = 2024, return_ids: bool = False):
     return values
 
 
-def load_cosilico_values(variable: str, year: int = 2024, return_ids: bool = False):
-    """Load Cosilico-computed values for a variable across CPS.
-
-    Uses the cosilico-data-sources runner infrastructure to compute values
-    using the same tax unit construction as PolicyEngine comparison.
-
-    Args:
-        variable: Variable name (e.g., 'eitc', 'income_tax', 'ctc')
-        year: Tax year
-        return_ids: If True, return (values, tax_unit_ids) tuple
-
-    Returns:
-        Array of values for each tax unit, or (values, ids) tuple
+@functools.lru_cache(maxsize=2)
+def _build_cosilico_tax_units(year: int):
+    """Build CPS tax units and run all Cosilico calculations once per year.
 
-    Raises:
-        ImportError: If cosilico-data-sources not available
+    Every variable reads its column from the same frame, so the build is
+    shared across run_variable_comparison calls instead of redone for each.
+    Call ``_build_cosilico_tax_units.cache_clear()`` to pick up changes to
+    cosilico-data-sources in a long-running process.
     """
     import sys
     from pathlib import Path
@@ -137,7 +192,27 @@ def load_cosilico_values(variable: str, year: int = 2024, return_ids: bool = Fal
 
     # Load and compute
     df = load_and_build_tax_units(year)
-    df = run_all_calculations(df, year)
+    return run_all_calculations(df, year)
+
+
+def load_cosilico_values(variable: str, year: int = 2024, return_ids: bool = False):
+    """Load Cosilico-computed values for a variable across CPS.
+
+    Uses the cosilico-data-sources runner infrastructure to compute values
+    using the same tax unit construction as PolicyEngine comparison.
+
+    Args:
+        variable: Variable name (e.g., 'eitc', 'income_tax', 'ctc')
+        year: Tax year
+        return_ids: If True, return (values, tax_unit_ids) tuple
+
+    Returns:
+        Array of values for each tax unit, or (values, ids) tuple
+
+    Raises:
+        ImportError: If cosilico-data-sources not available
+    """
+    df = _build_cosilico_tax_units(year)
 
     # Map variable names to cosilico column names
     column_map = {
@@ -182,21 +257,21 @@ def align_records(cos_values: np.ndarray, cos_ids: np.ndarray,
     Returns:
         Tuple of (aligned_cos_values, aligned_pe_values, matched_ids)
     """
-    # Find common IDs using set intersection
-    cos_id_set = set(cos_ids)
-    pe_id_set = set(pe_ids)
-    common_ids = np.array(sorted(cos_id_set & pe_id_set))
+    cos_ids = np.asarray(cos_ids)
+    pe_ids = np.asarray(pe_ids)
+
+    # Sorted common IDs plus their positions in each input. Searching the
+    # reversed arrays picks the last occurrence of a duplicated ID.
+    common_ids, cos_rev_idx, pe_rev_idx = np.intersect1d(
+        cos_ids[::-1], pe_ids[::-1], return_indices=True
+    )
 
     if len(common_ids) == 0:
         raise ValueError("No matching tax unit IDs between Cosilico and PolicyEngine")
 
-    # Create lookup dictionaries (O(n) construction, O(1) lookup)
-    cos_lookup = dict(zip(cos_ids, cos_values))
-    pe_lookup = dict(zip(pe_ids, pe_values))
-
     # Vectorized value extraction
-    aligned_cos = np.array([cos_lookup[id_] for id_ in common_ids])
-    aligned_pe = np.array([pe_lookup[id_] for id_ in common_ids])
+    aligned_cos = np.asarray(cos_values)[len(cos_ids) - 1 - cos_rev_idx]
+    aligned_pe = np.asarray(pe_values)[len(pe_ids) - 1 - pe_rev_idx]
 
     return aligned_cos, aligned_pe, common_ids
 
@@ -205,6 +280,7 @@ def run_variable_comparison(
     variable: str,
     year: int = 2024,
     tolerance: float = 1.0,
+    sim=None,
 ) -> dict:
     """Run full comparison for a single variable.
 
@@ -214,12 +290,13 @@ def run_variable_comparison(
         variable: Variable name to compare
         year: Tax year
         tolerance: Match tolerance in dollars
+        sim: PolicyEngine Microsimulation to reuse (default: build one)
 
     Returns:
         Comparison result dict
     """
     # Load with IDs for alignment
-    pe_values, pe_ids = load_pe_values(variable, year, return_ids=True)
+    pe_values, pe_ids = load_pe_values(variable, year, return_ids=True, sim=sim)
     cos_values, cos_ids = load_cosilico_values(variable, year, return_ids=True)
 
     # Align records
@@ -244,6 +321,9 @@ def run_full_comparison(
 ) -> dict:
     """Run comparison across all variables.
 
+    Variables share one PolicyEngine Microsimulation and one Cosilico build
+    for the year, so each is computed once rather than per variable.
+
     Args:
         variables: List of variables to compare (default: common tax variables)
         year: Tax year
@@ -259,21 +339,25 @@ def run_full_comparison(
             "adjusted_gross_income",
         ]
 
+    sim = None
     results = []
     for var in variables:
         try:
-            result = run_variable_comparison(var, year, tolerance)
-            results.append(result)
-            print(f"  {var}: {result['match_rate']*100:.1f}% match rate")
+            # Built on first use so a failure is reported per variable
+            if sim is None and HAS_POLICYENGINE:
+                sim = Microsimulation()
+            result = run_variable_comparison(var, year, tolerance, sim=sim)
+            logger.info("  %s: %.1f%% match rate", var, result["match_rate"] * 100)
         except Exception as e:
-            print(f"  {var}: ERROR - {e}")
-            results.append({
+            logger.warning("  %s: ERROR - %s", var, e)
+            result = {
                 "variable": var,
                 "year": year,
                 "error": str(e),
                 "match_rate": 0,
                 "n_records": 0,
-            })
+            }
+        results.append(result)
 
     return generate_dashboard_json(results, year)
 
@@ -288,9 +372,13 @@ def generate_dashboard_json(results: list[dict], year: int = 2024) -> dict:
     Returns:
         Dashboard-formatted dict
     """
-    # Overall summary
-    total_records = sum(r.get("n_records", 0) for r in results)
-    total_matches = sum(r.get("n_records", 0) * r.get("match_rate", 0) for r in results)
+    # Overall summary (single pass over results)
+    total_records = 0
+    total_matches = 0
+    for r in results:
+        n_records = r.get("n_records", 0)
+        total_records += n_records
+        total_matches += n_records * r.get("match_rate", 0)
     overall_match_rate = total_matches / total_records if total_records > 0 else 0.0
 
     return {
@@ -7,6 +7,8 @@ Variable mappings are loaded from variable_mappings.yaml, which references
 statute definitions in cosilico-us (e.g., 26/32/eitc.rac::earned_income_tax_credit).
 """
 
+import hashlib
+import os
 import sys
 import time
 from dataclasses import dataclass
@@ -17,6 +19,9 @@ from typing import Optional
 import numpy as np
 import yaml
 
+# libyaml's C loader is ~10x faster than the pure-Python one; same results
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_variable_mappings() -> dict[str, dict]:
     """Load variable mappings from YAML file.
@@ -36,7 +41,7 @@ def load_variable_mappings() -> dict[str, dict]:
     """
     yaml_path = Path(__file__).parent / "variable_mappings.yaml"
     with open(yaml_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YAML_LOADER)
 
     result = {}
     for var_name, config in data.get("variables", {}).items():
@@ -161,6 +166,22 @@ def load_cosilico_cps(year: int = 2024) -> TimedResult:
     return TimedResult(data=result, elapsed_ms=elapsed)
 
 
+def _person_to_tax_unit(
+    person_tax_unit_id: np.ndarray, tax_unit_ids: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map each person to their tax unit's position in ``tax_unit_ids``.
+
+    Uses a sorted lookup (O(n log n) instead of one full mask per tax unit).
+    Returns (positions of matched persons, mask of matched persons), ready
+    for ``np.bincount(positions, weights=values[mask])``.
+    """
+    order = np.argsort(tax_unit_ids)
+    sorted_ids = tax_unit_ids[order]
+    pos = np.searchsorted(sorted_ids, person_tax_unit_id).clip(max=len(tax_unit_ids) - 1)
+    found = sorted_ids[pos] == person_tax_unit_id
+    return order[pos[found]], found
+
+
 def load_policyengine_values(
     year: int = 2024,
     variables: Optional[list[str]] = None,
@@ -180,6 +201,12 @@ def load_policyengine_values(
 
     result = {"weight": np.array(sim.calculate("tax_unit_weight", year))}
     n_tax_units = len(result["weight"])
+    # Person -> tax unit position map, built once and shared by all
+    # person-level variables: (tax unit position, person has a tax unit)
+    person_to_tax_unit = None
+    # Several comparison variables can map to the same PE variable
+    # (e.g. income_tax_before_credits); compute each one once
+    pe_arrays: dict[str, np.ndarray] = {}
 
     for var_name in variables:
         if var_name not in COMPARISON_VARIABLES:
@@ -187,24 +214,30 @@ def load_policyengine_values(
         config = COMPARISON_VARIABLES[var_name]
         pe_var = config["pe_var"]
         pe_entity = config.get("pe_entity", "tax_unit")
+        if not pe_var:
+            # No PolicyEngine counterpart mapped; don't ask the sim for it
+            result[var_name] = np.zeros_like(result["weight"])
+            continue
+        if pe_var in pe_arrays:
+            result[var_name] = pe_arrays[pe_var]
+            continue
 
         try:
             values = np.array(sim.calculate(pe_var, year))
 
             if pe_entity == "person" and len(values) != n_tax_units:
                 # Need to aggregate person-level to tax unit
-                # Use person's tax unit ID to sum
-                person_tax_unit_id = np.array(sim.calculate("person_tax_unit_id", year))
-                tax_unit_ids = np.array(sim.calculate("tax_unit_id", year))
-
-                # Sum values by tax unit
-                aggregated = np.zeros(n_tax_units)
-                for i, tu_id in enumerate(tax_unit_ids):
-                    mask = person_tax_unit_id == tu_id
-                    aggregated[i] = values[mask].sum()
-                values = aggregated
-
-            result[var_name] = values
+                if person_to_tax_unit is None:
+                    person_to_tax_unit = _person_to_tax_unit(
+                        np.array(sim.calculate("person_tax_unit_id", year)),
+                        np.array(sim.calculate("tax_unit_id", year)),
+                    )
+                tu_pos, found = person_to_tax_unit
+                values = np.bincount(
+                    tu_pos, weights=values[found].astype(float), minlength=n_tax_units
+                )
+
+            result[var_name] = pe_arrays[pe_var] = values
         except Exception:
             result[var_name] = np.zeros_like(result["weight"])
 
@@ -213,19 +246,75 @@ def load_policyengine_values(
     return TimedResult(data=result, elapsed_ms=elapsed)
 
 
+def _taxsim_input_csv(df, year: int) -> str:
+    """Build the TAXSIM-35 input CSV for CPS tax units.
+
+    Uses minimal required fields (https://taxsim.nber.org/taxsim35/).
+    Columns are cleaned as whole arrays: missing, NaN or non-numeric values
+    take the field default and negatives are floored at zero. Constant
+    fields (year, state, idtl) are written as literals rather than
+    materialized per row.
+    """
+    import pandas as pd
+
+    n = len(df)
+
+    def column(name: str, default: float) -> np.ndarray:
+        if name not in df.columns:
+            return np.full(n, float(default))
+        values = pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=float)
+        return np.where(np.isnan(values), default, np.where(values > 0, values, 0.0))
+
+    # Map filing status: 1=single, 2=joint
+    is_joint = (
+        df["is_joint"].to_numpy().astype(bool) if "is_joint" in df.columns else np.zeros(n, dtype=bool)
+    )
+    mstat = np.where(is_joint, 2, 1)
+
+    page = np.maximum(np.trunc(column("head_age", 35)), 1).astype(np.int64)  # Must be at least 1
+    sage = np.where(is_joint, np.trunc(column("spouse_age", 0)), 0).astype(np.int64)
+    depx = np.trunc(column("num_eitc_children", 0)).astype(np.int64)
+    pwages = column("earned_income", 0.0)
+
+    prefix = f",{year},0,"
+    lines = ["taxsimid,year,state,mstat,page,sage,depx,pwages,idtl"]
+    lines.extend(
+        f"{i + 1}{prefix}{m},{p},{s},{d},{w:.2f},2"
+        for i, m, p, s, d, w in zip(
+            df.index.tolist(),
+            mstat.tolist(),
+            page.tolist(),
+            sage.tolist(),
+            depx.tolist(),
+            pwages.tolist(),
+        )
+    )
+    return "\n".join(lines)
+
+
+TAXSIM_CPS_CACHE_DIR = Path.home() / ".cache" / "cosilico-validators" / "taxsim-cps"
+
+
 def load_taxsim_values(
     year: int = 2024,
     variables: Optional[list[str]] = None,
+    use_cache: bool = True,
 ) -> TimedResult:
     """Load TAXSIM calculations by running local executable on CPS data.
 
+    TAXSIM output is cached under ``TAXSIM_CPS_CACHE_DIR``, keyed on a hash
+    of the executable (name, size and mtime) and the generated input CSV, so
+    reruns on unchanged CPS inputs skip the executable entirely, while a
+    replaced TAXSIM build invalidates the cache.
+
     Returns:
         TimedResult with dict of arrays and elapsed time in ms.
     """
-    import csv
     import io
     import subprocess
 
+    import pandas as pd
+
     from cosilico_validators.comparison.multi_validator import get_taxsim_executable_path
 
     start = time.perf_counter()
@@ -237,61 +326,42 @@ def load_taxsim_values(
     # Get TAXSIM executable
     taxsim_path = get_taxsim_executable_path()
 
-    # Build TAXSIM input CSV - use minimal required fields
-    # TAXSIM input format: https://taxsim.nber.org/taxsim35/
-    lines = ["taxsimid,year,state,mstat,page,sage,depx,pwages,idtl"]
-
-    for i, row in df.iterrows():
-        # Map filing status: 1=single, 2=joint
-        mstat = 2 if row.get("is_joint", False) else 1
-
-        # Handle NaN values
-        def safe_int(val, default=0):
-            try:
-                if val is None or (isinstance(val, float) and np.isnan(val)):
-                    return default
-                return max(0, int(val))
-            except (ValueError, TypeError):
-                return default
+    input_csv = _taxsim_input_csv(df, year)
+
+    exe_stat = taxsim_path.stat()
+    exe_id = f"{taxsim_path.name}:{exe_stat.st_size}:{exe_stat.st_mtime_ns}"
+    cache_key = hashlib.sha256(f"{exe_id}\n{input_csv}".encode()).hexdigest()[:16]
+    cache_path = TAXSIM_CPS_CACHE_DIR / f"{cache_key}.csv"
+    if use_cache and cache_path.exists():
+        output_csv = cache_path.read_text()
+    else:
+        # Run TAXSIM
+        result = subprocess.run(
+            [str(taxsim_path)],
+            input=input_csv,
+            capture_output=True,
+            text=True,
+            timeout=600,
+        )
 
-        def safe_float(val, default=0.0):
-            try:
-                if val is None or (isinstance(val, float) and np.isnan(val)):
-                    return default
-                return max(0.0, float(val))
-            except (ValueError, TypeError):
-                return default
-
-        page = safe_int(row.get("head_age", 35), 35)
-        page = max(1, page)  # Must be at least 1
-        sage = safe_int(row.get("spouse_age", 0)) if mstat == 2 else 0
-        depx = safe_int(row.get("num_eitc_children", 0))
-        pwages = safe_float(row.get("earned_income", 0))
-
-        lines.append(f"{i+1},{year},0,{mstat},{page},{sage},{depx},{pwages:.2f},2")
-
-    input_csv = "\n".join(lines)
-
-    # Run TAXSIM
-    result = subprocess.run(
-        [str(taxsim_path)],
-        input=input_csv,
-        capture_output=True,
-        text=True,
-        timeout=600,
-    )
+        if result.returncode != 0:
+            raise RuntimeError(f"TAXSIM failed: {result.stderr}")
+        output_csv = result.stdout
 
-    if result.returncode != 0:
-        raise RuntimeError(f"TAXSIM failed: {result.stderr}")
+        if use_cache:
+            # Atomic write so an interrupted run never leaves a partial entry
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(output_csv)
+            tmp_path.replace(cache_path)
 
-    # Parse output
-    output_lines = result.stdout.strip().split("\n")
-    reader = csv.DictReader(output_lines)
-    output_records = list(reader)
+    # Parse output once into float64 columns (C parser, no per-record dicts)
+    output_csv = output_csv.strip()
+    output_df = pd.read_csv(io.StringIO(output_csv)) if output_csv else pd.DataFrame()
 
     # Extract values
-    n_records = len(output_records)
-    weights = df["weight"].values[:n_records]
+    n_records = len(output_df)
+    weights = df["weight"].to_numpy()[:n_records]
 
     if variables is None:
         variables = list(COMPARISON_VARIABLES.keys())
@@ -303,8 +373,8 @@ def load_taxsim_values(
             continue
         config = COMPARISON_VARIABLES[var_name]
         ts_var = config.get("ts_var")
-        if ts_var and output_records and ts_var in output_records[0]:
-            data[var_name] = np.array([float(r.get(ts_var, 0) or 0) for r in output_records])
+        if ts_var and ts_var in output_df.columns:
+            data[var_name] = output_df[ts_var].fillna(0).to_numpy(dtype=np.float64)
         else:
             data[var_name] = np.zeros(n_records)
 
@@ -439,12 +509,8 @@ def export_to_dashboard(
     year: int = 2024,
 ) -> dict:
     """Export comparison results to dashboard JSON format."""
-    sections = []
-    total_cos_time = 0.0
-    total_pe_time = 0.0
-
-    for var_name, totals in comparison.items():
-        sections.append({
+    sections = [
+        {
             "variable": var_name,
             "title": totals.title,
             "cosilico_total": totals.cosilico_total,
@@ -454,11 +520,14 @@ def export_to_dashboard(
             "match_rate": totals.match_rate,
             "mean_absolute_error": totals.mean_absolute_error,
             "n_records": totals.n_records,
-        })
-        total_cos_time = totals.cosilico_time_ms  # Same for all vars
-        total_pe_time = totals.policyengine_time_ms
+        }
+        for var_name, totals in comparison.items()
+    ]
 
     all_totals = list(comparison.values())
+    # Load times are the same for all vars
+    total_cos_time = all_totals[-1].cosilico_time_ms if all_totals else 0.0
+    total_pe_time = all_totals[-1].policyengine_time_ms if all_totals else 0.0
     overall_match = np.mean([t.match_rate for t in all_totals]) if all_totals else 0
     overall_mae = np.mean([t.mean_absolute_error for t in all_totals]) if all_totals else 0
 
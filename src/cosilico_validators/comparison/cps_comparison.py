@@ -12,6 +12,21 @@ from policyengine_us import Microsimulation
 from tax_unit_builder import load_and_build_tax_units
 from cosilico_runner import run_all_calculations
 
+# Output column -> PolicyEngine tax unit variable
+PE_COLUMNS = {
+    "tax_unit_id": "tax_unit_id",
+    "pe_eitc": "eitc",
+    "pe_ctc_nonref": "non_refundable_ctc",
+    "pe_ctc_ref": "refundable_ctc",
+    "pe_income_tax": "income_tax_before_credits",
+    "pe_se_tax": "self_employment_tax",
+    "pe_niit": "net_investment_income_tax",
+    # Key inputs for comparison
+    "pe_agi": "adjusted_gross_income",
+    "pe_taxable_income": "taxable_income",
+    "pe_earned_income": "tax_unit_earned_income",
+}
+
 
 def get_pe_values(year: int = 2024) -> pd.DataFrame:
     """Get PolicyEngine calculated values for CPS."""
@@ -19,20 +34,9 @@ def get_pe_values(year: int = 2024) -> pd.DataFrame:
     sim = Microsimulation()
 
     # Tax unit level variables
-    tu_id = np.array(sim.calculate("tax_unit_id", year))
-
     results = pd.DataFrame({
-        'tax_unit_id': tu_id,
-        'pe_eitc': np.array(sim.calculate("eitc", year)),
-        'pe_ctc_nonref': np.array(sim.calculate("non_refundable_ctc", year)),
-        'pe_ctc_ref': np.array(sim.calculate("refundable_ctc", year)),
-        'pe_income_tax': np.array(sim.calculate("income_tax_before_credits", year)),
-        'pe_se_tax': np.array(sim.calculate("self_employment_tax", year)),
-        'pe_niit': np.array(sim.calculate("net_investment_income_tax", year)),
-        # Get key inputs for comparison
-        'pe_agi': np.array(sim.calculate("adjusted_gross_income", year)),
-        'pe_taxable_income': np.array(sim.calculate("taxable_income", year)),
-        'pe_earned_income': np.array(sim.calculate("tax_unit_earned_income", year)),
+        column: np.array(sim.calculate(variable, year))
+        for column, variable in PE_COLUMNS.items()
     })
 
     results['pe_ctc_total'] = results['pe_ctc_nonref'] + results['pe_ctc_ref']
@@ -11,6 +11,7 @@ This isolates differences in rule implementations vs input data handling.
 import os
 import platform
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Optional
@@ -220,34 +221,28 @@ def compare_microdata(
     # Build test cases for batch processing
     test_cases = [input_builder(i) for i in range(n)]
 
-    # Collect results per validator
-    validator_values: dict[str, list[float | None]] = {
-        name: [] for name in validator_instances
-    }
-
-    print(f"Running {len(validator_instances)} validators on {n} records...")
-
-    for name, validator in validator_instances.items():
-        print(f"  {name}...", end=" ", flush=True)
-
+    def collect(validator) -> list[float | None]:
         # Try batch validation if available
         if hasattr(validator, "batch_validate"):
             results = validator.batch_validate(test_cases, variable, year)
-            for r in results:
-                validator_values[name].append(
-                    r.calculated_value if r.success else None
-                )
         else:
             # Fall back to single validation
-            for tc in test_cases:
-                result = validator.validate(tc, variable, year)
-                validator_values[name].append(
-                    result.calculated_value if result.success else None
-                )
+            results = [validator.validate(tc, variable, year) for tc in test_cases]
+        return [r.calculated_value if r.success else None for r in results]
 
+    print(f"Running {len(validator_instances)} validators on {n} records...")
+
+    # Validators are independent (subprocesses / C-level work), so run
+    # them concurrently and report in order once all are done
+    with ThreadPoolExecutor(max_workers=max(len(validator_instances), 1)) as executor:
+        validator_values: dict[str, list[float | None]] = dict(
+            zip(validator_instances, executor.map(collect, validator_instances.values()))
+        )
+
+    for name, values in validator_values.items():
         # Count successful results
-        success_count = sum(1 for v in validator_values[name] if v is not None)
-        print(f"{success_count}/{n} successful")
+        success_count = sum(1 for v in values if v is not None)
+        print(f"  {name}... {success_count}/{n} successful")
 
     # Compute match rates and errors
     match_rates = {}
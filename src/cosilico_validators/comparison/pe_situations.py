@@ -0,0 +1,33 @@
+"""Batch single-unit PolicyEngine situations into one multi-unit Simulation."""
+
+# Group entities given one group per case in a combined situation. An entity
+# a case situation leaves out gets one group holding all of that case's
+# people, as PE does by default for a single-case situation. Without that,
+# PE would build one default group spanning every case in the batch.
+PE_GROUP_ENTITIES = ("tax_units", "families", "spm_units", "marital_units", "households")
+
+
+def combine_pe_situations(situations: list[dict]) -> tuple[dict, list[int]]:
+    """Merge single-unit situations into one multi-unit situation.
+
+    Person and group names get a ``_{i}`` suffix so cases stay distinct. PE
+    orders each entity by insertion, so group-level outputs line up with
+    ``situations``.
+
+    Returns:
+        (combined situation, index of each case's primary filer in people)
+    """
+    combined = {"people": {}, **{entity: {} for entity in PE_GROUP_ENTITIES}}
+    primary_idx = []
+    for i, situation in enumerate(situations):
+        primary_idx.append(len(combined["people"]))
+        for name, person in situation["people"].items():
+            combined["people"][f"{name}_{i}"] = person
+        for entity in PE_GROUP_ENTITIES:
+            groups = situation.get(entity) or {entity: {"members": list(situation["people"])}}
+            for name, group in groups.items():
+                combined[entity][f"{name}_{i}"] = {
+                    **group,
+                    "members": [f"{member}_{i}" for member in group["members"]],
+                }
+    return combined, primary_idx
@@ -4,19 +4,116 @@ All models run on the SAME input data from our CPS tax units.
 This allows direct record-by-record comparison of outputs.
 """
 
+import functools
+import hashlib
+import multiprocessing
+import os
 import sys
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Mapping, Optional
 
 import numpy as np
 import pandas as pd
 
+from cosilico_validators.comparison.pe_situations import combine_pe_situations
+
+# Conditional imports
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    numba = None
+
+try:
+    import pyarrow.csv as pacsv
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pacsv = None
+
+# cosilico-data-sources is not a package; its modules live in this directory
+_DATA_SOURCES = Path.home() / "CosilicoAI" / "cosilico-data-sources" / "micro" / "us"
+
+
+@functools.cache
+def _load_data_sources():
+    """Import the cosilico-data-sources modules on first use.
+
+    Returns:
+        (tax_unit_builder module, run_all_calculations)
+    """
+    if str(_DATA_SOURCES) not in sys.path:
+        sys.path.insert(0, str(_DATA_SOURCES))
+    try:
+        import tax_unit_builder
+        from cosilico_runner import run_all_calculations
+    except ImportError as e:
+        raise ImportError(f"cosilico-data-sources not found at {_DATA_SOURCES}: {e}") from e
+    return tax_unit_builder, run_all_calculations
+
+
+# Model order of the arrays returned by _stats_kernel
+_STATS_MODELS = ("cosilico", "policyengine", "taxsim", "taxcalc")
+_DIFF_MODELS = ("cosilico", "taxsim", "taxcalc")
+
+if HAS_NUMBA:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _stats_kernel(cos, pe, ts, tc, w, tol):
+        """Single pass over records accumulating all weighted stats.
+
+        Returns (weighted sums[4], weighted |diff vs pe|[3], matched weight[3]).
+        """
+        cos_sum = pe_sum = ts_sum = tc_sum = 0.0
+        cos_abs = ts_abs = tc_abs = 0.0
+        cos_match = ts_match = tc_match = 0.0
+        for i in numba.prange(w.shape[0]):
+            wi = w[i]
+            p = pe[i]
+            cos_sum += cos[i] * wi
+            pe_sum += p * wi
+            ts_sum += ts[i] * wi
+            tc_sum += tc[i] * wi
+            d_cos = abs(cos[i] - p)
+            d_ts = abs(ts[i] - p)
+            d_tc = abs(tc[i] - p)
+            cos_abs += d_cos * wi
+            ts_abs += d_ts * wi
+            tc_abs += d_tc * wi
+            cos_match += wi * (d_cos <= tol)
+            ts_match += wi * (d_ts <= tol)
+            tc_match += wi * (d_tc <= tol)
+        return (
+            np.array([cos_sum, pe_sum, ts_sum, tc_sum]),
+            np.array([cos_abs, ts_abs, tc_abs]),
+            np.array([cos_match, ts_match, tc_match]),
+        )
+
+else:
+
+    def _stats_kernel(cos, pe, ts, tc, w, tol):
+        """NumPy fallback for the fused stats kernel (numba not installed)."""
+        sums = np.array([cos @ w, pe @ w, ts @ w, tc @ w])
+        abs_diffs = np.abs(np.stack([cos, ts, tc]) - pe)
+        # One mask per model; gather matched weights rather than mask * w
+        matched = np.array([w[mask].sum() for mask in abs_diffs <= tol])
+        return sums, abs_diffs @ w, matched
+
 
 @dataclass
 class RecordComparison:
-    """Comparison results for a single variable across all models."""
+    """Comparison results for a single variable across all models.
+
+    Model arrays may be float32 (see ``compare_records(precision=...)``);
+    weights are float64, so weighted stats accumulate in float64.
+    """
     variable: str
     n_records: int
 
@@ -33,87 +130,154 @@ class RecordComparison:
     taxsim_ms: float
     taxcalc_ms: float
 
+    # Total weight, cached once in __post_init__
+    _w_sum: float = field(init=False, repr=False)
+    # stats() results keyed by tolerance
+    _stats_cache: dict = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self):
+        self._w_sum = float(self.weights.sum())
+
+    def stats(self, tolerance: float = 1.0) -> dict[str, dict[str, float]]:
+        """Weighted totals, MAE and match rate vs PolicyEngine in one pass.
+
+        Returns:
+            Dict with "weighted_totals", "mean_abs_diff_vs_pe" and
+            "match_rate_vs_pe" keys, each mapping model name to value.
+        """
+        if tolerance not in self._stats_cache:
+            sums, abs_diffs, matched = _stats_kernel(
+                self.cosilico, self.policyengine, self.taxsim, self.taxcalc,
+                self.weights, tolerance,
+            )
+            w_sum = self._w_sum
+            self._stats_cache[tolerance] = {
+                "weighted_totals": {m: float(v) for m, v in zip(_STATS_MODELS, sums)},
+                "mean_abs_diff_vs_pe": {m: float(v / w_sum) for m, v in zip(_DIFF_MODELS, abs_diffs)},
+                "match_rate_vs_pe": {m: float(v / w_sum) for m, v in zip(_DIFF_MODELS, matched)},
+            }
+        return self._stats_cache[tolerance]
+
     @property
     def weighted_totals(self) -> dict[str, float]:
-        return {
-            "cosilico": float((self.cosilico * self.weights).sum()),
-            "policyengine": float((self.policyengine * self.weights).sum()),
-            "taxsim": float((self.taxsim * self.weights).sum()),
-            "taxcalc": float((self.taxcalc * self.weights).sum()),
-        }
+        return self.stats()["weighted_totals"]
 
     @property
     def mean_abs_diff_vs_pe(self) -> dict[str, float]:
         """Mean absolute difference vs PolicyEngine (weighted)."""
-        pe = self.policyengine
-        return {
-            "cosilico": float((np.abs(self.cosilico - pe) * self.weights).sum() / self.weights.sum()),
-            "taxsim": float((np.abs(self.taxsim - pe) * self.weights).sum() / self.weights.sum()),
-            "taxcalc": float((np.abs(self.taxcalc - pe) * self.weights).sum() / self.weights.sum()),
-        }
+        return self.stats()["mean_abs_diff_vs_pe"]
 
-    @property
     def match_rate_vs_pe(self, tolerance: float = 1.0) -> dict[str, float]:
         """Fraction of records matching PolicyEngine within tolerance."""
-        pe = self.policyengine
-        w = self.weights
-        total_weight = w.sum()
-        return {
-            "cosilico": float(((np.abs(self.cosilico - pe) <= tolerance) * w).sum() / total_weight),
-            "taxsim": float(((np.abs(self.taxsim - pe) <= tolerance) * w).sum() / total_weight),
-            "taxcalc": float(((np.abs(self.taxcalc - pe) <= tolerance) * w).sum() / total_weight),
-        }
+        return self.stats(tolerance)["match_rate_vs_pe"]
+
+
+CPS_CACHE_DIR = Path.home() / ".cache" / "cosilico-validators" / "cps"
+
+
+def load_cps_inputs(year: int = 2024, use_cache: bool = True) -> pd.DataFrame:
+    """Load our CPS tax units - the common input for all models.
+
+    Built tax units are cached as parquet under ``CPS_CACHE_DIR``. The cache
+    filename includes a hash of the builder module's mtime, so editing
+    ``tax_unit_builder`` invalidates stale caches.
+    """
+    tax_unit_builder, _ = _load_data_sources()
+
+    builder_mtime = Path(tax_unit_builder.__file__).stat().st_mtime_ns
+    builder_hash = hashlib.sha256(str(builder_mtime).encode()).hexdigest()[:12]
+    cache_path = CPS_CACHE_DIR / f"cps_{year}_{builder_hash}.parquet"
 
+    if use_cache and cache_path.exists():
+        return pd.read_parquet(cache_path)
 
-def load_cps_inputs(year: int = 2024) -> pd.DataFrame:
-    """Load our CPS tax units - the common input for all models."""
-    data_sources = Path.home() / "CosilicoAI" / "cosilico-data-sources" / "micro" / "us"
-    if str(data_sources) not in sys.path:
-        sys.path.insert(0, str(data_sources))
+    df = tax_unit_builder.load_and_build_tax_units(year)
 
-    from tax_unit_builder import load_and_build_tax_units
-    return load_and_build_tax_units(year)
+    # No parquet engine (pyarrow) installed - skip caching
+    if use_cache and HAS_PYARROW:
+        # Atomic write so a concurrent reader never sees a partial file
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp_path, compression="zstd")
+        tmp_path.replace(cache_path)
+
+    return df
 
 
 def run_cosilico(df: pd.DataFrame, year: int = 2024) -> tuple[pd.DataFrame, float]:
-    """Run Cosilico on CPS data. Returns (results_df, elapsed_ms)."""
-    data_sources = Path.home() / "CosilicoAI" / "cosilico-data-sources" / "micro" / "us"
-    if str(data_sources) not in sys.path:
-        sys.path.insert(0, str(data_sources))
+    """Run Cosilico on CPS data. Returns (results_df, elapsed_ms).
 
-    from cosilico_runner import run_all_calculations
+    ``run_all_calculations`` only adds output columns, so it gets a shallow
+    copy: a fresh frame sharing ``df``'s column data rather than a full copy.
+    """
+    _, run_all_calculations = _load_data_sources()
 
     start = time.perf_counter()
-    result = run_all_calculations(df.copy(), year)
+    result = run_all_calculations(df.copy(deep=False), year)
     elapsed = (time.perf_counter() - start) * 1000
 
     return result, elapsed
 
 
-def run_policyengine(df: pd.DataFrame, year: int = 2024) -> tuple[pd.DataFrame, float]:
-    """Run PolicyEngine on CPS data. Returns (results_df, elapsed_ms)."""
+# PolicyEngine outputs computed by run_policyengine
+_PE_VARIABLES = (
+    "eitc",
+    "non_refundable_ctc",
+    "refundable_ctc",
+    "income_tax_before_credits",
+    "self_employment_tax",
+    "adjusted_gross_income",
+)
+
+
+def _run_pe_batch(args: tuple[list[dict], int]) -> pd.DataFrame:
+    """Run PolicyEngine on a batch of situations as one multi-unit Simulation.
+
+    Module-level so Pool can pickle it. Returns one row per situation.
+    """
     from policyengine_us import Simulation
 
+    situations, year = args
+    situation, _ = combine_pe_situations(situations)
+    sim = Simulation(situation=situation)
+
+    # One (n_units, n_vars) float64 block; PE reuses cached intermediates
+    # across these calculate() calls on the same Simulation.
+    values = np.column_stack([
+        np.asarray(sim.calculate(var, year, map_to="tax_unit"), dtype=np.float64)
+        for var in _PE_VARIABLES
+    ])
+    return pd.DataFrame(values, columns=list(_PE_VARIABLES))
+
+
+def run_policyengine(
+    df: pd.DataFrame,
+    year: int = 2024,
+    processes: Optional[int] = None,
+    batch_size: int = 1000,
+) -> tuple[pd.DataFrame, float]:
+    """Run PolicyEngine on CPS data. Returns (results_df, elapsed_ms).
+
+    Tax units are grouped into batches of ``batch_size``; each batch runs as
+    a single vectorized Simulation, and batches are spread across a process
+    pool. ``imap`` keeps results in the same order as ``df``.
+    """
+    from policyengine_us import Simulation  # noqa: F401 - fail fast before starting workers
+
     start = time.perf_counter()
-    results = []
-
-    # Run PE on each tax unit
-    for idx, row in df.iterrows():
-        situation = _create_pe_situation(row, year)
-        sim = Simulation(situation=situation)
-
-        result = {
-            "eitc": float(sim.calculate("eitc", year).sum()),
-            "non_refundable_ctc": float(sim.calculate("non_refundable_ctc", year).sum()),
-            "refundable_ctc": float(sim.calculate("refundable_ctc", year).sum()),
-            "income_tax_before_credits": float(sim.calculate("income_tax_before_credits", year).sum()),
-            "self_employment_tax": float(sim.calculate("self_employment_tax", year).sum()),
-            "adjusted_gross_income": float(sim.calculate("adjusted_gross_income", year).sum()),
-        }
-        results.append(result)
+
+    situations = [_create_pe_situation(row, year) for row in _pe_input_rows(df)]
+    batches = [situations[i:i + batch_size] for i in range(0, len(situations), batch_size)]
+
+    # Spawned (not forked) workers: compare_records runs this while its
+    # Cosilico and TAXSIM threads are live, and forking a threaded process
+    # can copy a held lock into the child and deadlock it.
+    with multiprocessing.get_context("spawn").Pool(processes or os.cpu_count()) as pool:
+        results = list(pool.imap(_run_pe_batch, zip(batches, repeat(year))))
 
     elapsed = (time.perf_counter() - start) * 1000
-    result_df = pd.DataFrame(results, index=df.index)
+    result_df = pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+    result_df.index = df.index
 
     return result_df, elapsed
 
@@ -132,7 +296,39 @@ def _safe_float(val, default: float = 0.0) -> float:
     return float(val)
 
 
-def _create_pe_situation(row: pd.Series, year: int) -> dict:
+# CPS tax unit columns read by _create_pe_situation
+_PE_INPUT_COLUMNS = (
+    "is_joint",
+    "num_dependents",
+    "head_age",
+    "spouse_age",
+    "wage_income",
+    "self_employment_income",
+    "social_security_income",
+    "interest_income",
+    "dividend_income",
+    "rental_income",
+    "unemployment_compensation",
+    "num_eitc_children",
+    "num_ctc_children",
+    "num_other_dependents",
+)
+
+
+def _pe_input_rows(df: pd.DataFrame) -> Iterator[dict]:
+    """Yield one plain dict per tax unit with the columns PE needs.
+
+    Columns are pulled out once as Python lists, avoiding the per-row
+    Series construction of ``df.iterrows()``. Missing columns are omitted so
+    ``_create_pe_situation`` falls back to its defaults.
+    """
+    columns = [col for col in _PE_INPUT_COLUMNS if col in df.columns]
+    values = [df[col].tolist() for col in columns]
+    for row in zip(*values):
+        yield dict(zip(columns, row))
+
+
+def _create_pe_situation(row: Mapping, year: int) -> dict:
     """Create PolicyEngine situation from a CPS tax unit row."""
     is_joint = bool(row.get("is_joint", False))
     n_deps = _safe_int(row.get("num_dependents", 0))
@@ -225,11 +421,119 @@ def _create_pe_situation(row: pd.Series, year: int) -> dict:
     return situation
 
 
-def run_taxsim(df: pd.DataFrame, year: int = 2024) -> tuple[pd.DataFrame, float]:
-    """Run TAXSIM on CPS data. Returns (results_df, elapsed_ms)."""
-    import csv
+# TAXSIM output column -> our variable name
+_TAXSIM_OUTPUT_COLUMNS = {
+    "v25": "eitc",
+    "v22": "non_refundable_ctc",
+    "actc": "refundable_ctc",
+    "v19": "income_tax_before_credits",
+    "v10": "adjusted_gross_income",
+}
+
+
+def _numeric_column(df: pd.DataFrame, name: str, default: float) -> pd.Series:
+    """Column as numbers with NaN (or a missing column) replaced by default."""
+    if name not in df.columns:
+        return pd.Series(default, index=df.index)
+    return pd.to_numeric(df[name], errors="coerce").fillna(default)
+
+
+def _build_taxsim_input(df: pd.DataFrame, year: int) -> pd.DataFrame:
+    """Build the TAXSIM input frame for CPS tax units, one row per unit."""
+    is_joint = (
+        df["is_joint"].fillna(False).astype(bool)
+        if "is_joint" in df.columns
+        else pd.Series(False, index=df.index)
+    )
+    zeros = np.zeros(len(df), dtype=np.float64)
+
+    def amount(name: str) -> np.ndarray:
+        return _numeric_column(df, name, 0.0).clip(lower=0).to_numpy(dtype=np.float64)
+
+    return pd.DataFrame({
+        "taxsimid": np.arange(1, len(df) + 1),
+        "year": year,
+        "state": 0,
+        "mstat": np.where(is_joint, 2, 1),
+        "page": _numeric_column(df, "head_age", 40).astype(int).clip(lower=1).to_numpy(),
+        "sage": np.where(is_joint, _numeric_column(df, "spouse_age", 0).astype(int), 0),
+        "depx": _numeric_column(df, "num_dependents", 0).astype(int).to_numpy(),
+        "pwages": amount("wage_income"),
+        "swages": zeros,  # We don't split wages
+        "dividends": amount("dividend_income"),
+        "intrec": amount("interest_income"),
+        "ltcg": zeros,
+        "stcg": zeros,
+        "otherprop": amount("rental_income"),
+        "pensions": zeros,
+        "gssi": amount("social_security_income"),
+        "psemp": amount("self_employment_income"),
+        "ssemp": zeros,
+        "idtl": 2,
+    })
+
+
+def _read_taxsim_output(data: bytes) -> pd.DataFrame:
+    """Parse TAXSIM CSV output into our variables (missing columns become 0).
+
+    Uses pyarrow's multithreaded CSV reader when installed, pandas otherwise.
+    """
     import io
+
+    columns = list(_TAXSIM_OUTPUT_COLUMNS)
+    if HAS_PYARROW:
+        table = pacsv.read_csv(
+            io.BytesIO(data),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=columns,
+                include_missing_columns=True,
+            ),
+        )
+        out_df = table.to_pandas()
+    else:
+        out_df = pd.read_csv(io.BytesIO(data), usecols=lambda col: col in _TAXSIM_OUTPUT_COLUMNS)
+
+    return (
+        out_df.reindex(columns=columns, fill_value=0.0)
+        .astype(float)
+        .fillna(0.0)
+        .rename(columns=_TAXSIM_OUTPUT_COLUMNS)
+    )
+
+
+def _pump_taxsim_input(
+    stdin, input_df: pd.DataFrame, errors: list[BaseException], chunk_rows: int = 10_000
+) -> None:
+    """Write TAXSIM input CSV to the subprocess in row chunks, then close stdin.
+
+    Runs on a writer thread, so failures are appended to ``errors`` for the
+    caller to re-raise. stdin is always closed so TAXSIM sees EOF.
+    """
+    try:
+        try:
+            stdin.write((",".join(input_df.columns) + "\n").encode())
+            for i in range(0, len(input_df), chunk_rows):
+                block = input_df.iloc[i:i + chunk_rows]
+                stdin.write(
+                    block.to_csv(index=False, header=False, float_format="%.2f", lineterminator="\n").encode()
+                )
+        finally:
+            stdin.close()
+    except BrokenPipeError:
+        pass  # TAXSIM exited early; its return code and stderr say why
+    except Exception as e:
+        errors.append(e)
+
+
+def run_taxsim(df: pd.DataFrame, year: int = 2024) -> tuple[pd.DataFrame, float]:
+    """Run TAXSIM on CPS data. Returns (results_df, elapsed_ms).
+
+    Input is streamed to TAXSIM from a writer thread while the main thread
+    collects its output, so serialization overlaps with TAXSIM's run.
+    """
     import subprocess
+    import tempfile
+    import threading
 
     from cosilico_validators.comparison.multi_validator import get_taxsim_executable_path
 
@@ -238,68 +542,55 @@ def run_taxsim(df: pd.DataFrame, year: int = 2024) -> tuple[pd.DataFrame, float]
     taxsim_path = get_taxsim_executable_path()
 
     # Build TAXSIM input
-    lines = ["taxsimid,year,state,mstat,page,sage,depx,pwages,swages,dividends,intrec,ltcg,stcg,otherprop,pensions,gssi,psemp,ssemp,idtl"]
-
-    for i, (idx, row) in enumerate(df.iterrows()):
-        mstat = 2 if row.get("is_joint", False) else 1
-        page = max(1, _safe_int(row.get("head_age"), 40))
-        sage = _safe_int(row.get("spouse_age"), 0) if mstat == 2 else 0
-        depx = _safe_int(row.get("num_dependents"), 0)
-
-        pwages = max(0, _safe_float(row.get("wage_income")))
-        swages = 0  # We don't split wages
-        dividends = max(0, _safe_float(row.get("dividend_income")))
-        intrec = max(0, _safe_float(row.get("interest_income")))
-        ltcg = 0
-        stcg = 0
-        otherprop = max(0, _safe_float(row.get("rental_income")))
-        pensions = 0
-        gssi = max(0, _safe_float(row.get("social_security_income")))
-        psemp = max(0, _safe_float(row.get("self_employment_income")))
-        ssemp = 0
-
-        lines.append(f"{i+1},{year},0,{mstat},{page},{sage},{depx},{pwages:.2f},{swages:.2f},{dividends:.2f},{intrec:.2f},{ltcg:.2f},{stcg:.2f},{otherprop:.2f},{pensions:.2f},{gssi:.2f},{psemp:.2f},{ssemp:.2f},2")
-
-    input_csv = "\n".join(lines)
-
-    # Run TAXSIM
-    result = subprocess.run(
-        [str(taxsim_path)],
-        input=input_csv,
-        capture_output=True,
-        text=True,
-        timeout=600,
-    )
-
-    if result.returncode != 0:
-        raise RuntimeError(f"TAXSIM failed: {result.stderr}")
-
-    # Parse output
-    output_lines = result.stdout.strip().split("\n")
-    reader = csv.DictReader(output_lines)
-    output_records = list(reader)
-
-    # Map TAXSIM output to our variables
-    results = []
-    for rec in output_records:
-        results.append({
-            "eitc": float(rec.get("v25", 0) or 0),
-            "non_refundable_ctc": float(rec.get("v22", 0) or 0),
-            "refundable_ctc": float(rec.get("actc", 0) or 0),
-            "income_tax_before_credits": float(rec.get("v19", 0) or 0),
-            "adjusted_gross_income": float(rec.get("v10", 0) or 0),
-        })
+    input_df = _build_taxsim_input(df, year)
+
+    # Run TAXSIM. stderr goes to a temp file so a chatty TAXSIM can't block
+    # on a full pipe while we are reading stdout.
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(
+            [str(taxsim_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+        )
+        writer_errors = []
+        writer = threading.Thread(
+            target=_pump_taxsim_input, args=(proc.stdin, input_df, writer_errors), daemon=True
+        )
+        watchdog = threading.Timer(600, proc.kill)
+        writer.start()
+        watchdog.start()
+        try:
+            output = proc.stdout.read()
+            proc.wait()
+        finally:
+            watchdog.cancel()
+            writer.join()
+            proc.stdout.close()
+
+        if writer_errors:
+            raise writer_errors[0]
+        if proc.returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"TAXSIM failed: {stderr.read().decode(errors='replace')}")
+
+    result_df = _read_taxsim_output(output)
 
     elapsed = (time.perf_counter() - start) * 1000
-    result_df = pd.DataFrame(results, index=df.index[:len(results)])
+    result_df.index = df.index[:len(result_df)]
 
     return result_df, elapsed
 
 
+# compare_records precision option -> dtype for model output arrays
+_PRECISION_DTYPES = {"fp32": np.float32, "fp64": np.float64}
+
+
 def compare_records(
     year: int = 2024,
     variables: Optional[list[str]] = None,
     sample_size: Optional[int] = None,
+    precision: str = "fp64",
 ) -> dict[str, RecordComparison]:
     """Run all models on same CPS data and compare record by record.
 
@@ -307,6 +598,11 @@ def compare_records(
         year: Tax year
         variables: Variables to compare (default: core set)
         sample_size: Limit to N records for faster testing
+        precision: "fp64" (default) keeps full precision. "fp32" stores model
+            outputs as float32 to halve memory traffic in the stats pass, but
+            its spacing near $1M incomes approaches the $1 tolerance, so
+            borderline records can flip between match and mismatch.
+            Weights stay float64 either way.
 
     Returns:
         Dict mapping variable names to RecordComparison objects
@@ -314,6 +610,10 @@ def compare_records(
     if variables is None:
         variables = ["eitc", "non_refundable_ctc", "refundable_ctc"]
 
+    if precision not in _PRECISION_DTYPES:
+        raise ValueError(f"precision must be one of {list(_PRECISION_DTYPES)}, got {precision!r}")
+    dtype = _PRECISION_DTYPES[precision]
+
     # Load common input data
     print("Loading CPS inputs...")
     df = load_cps_inputs(year)
@@ -323,40 +623,54 @@ def compare_records(
 
     print(f"Running on {len(df):,} tax units...")
 
-    # Run each model on same data
-    print("  Running Cosilico...")
-    cos_df, cos_ms = run_cosilico(df, year)
-
-    print("  Running PolicyEngine...")
-    pe_df, pe_ms = run_policyengine(df, year)
+    # Run each model on same data. The models are independent, so Cosilico
+    # and TAXSIM (a subprocess) run on worker threads while PolicyEngine
+    # drives its process pool from this thread.
+    print("  Running Cosilico, PolicyEngine and TAXSIM...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cos_future = executor.submit(run_cosilico, df, year)
+        ts_future = executor.submit(run_taxsim, df, year)
+        pe_df, pe_ms = run_policyengine(df, year)
+        cos_df, cos_ms = cos_future.result()
+        ts_df, ts_ms = ts_future.result()
+
+    # Extract each model's arrays once. Missing variables share one
+    # read-only zeros array, which RecordComparison never writes to.
+    n_records = len(df)
+    zeros = np.zeros(n_records, dtype=dtype)
+    zeros.flags.writeable = False
+
+    def model_arrays(model_df: pd.DataFrame) -> dict[str, np.ndarray]:
+        columns = set(model_df.columns)
+        return {
+            var: model_df[var].to_numpy(dtype=dtype, copy=False) if var in columns else zeros
+            for var in variables
+        }
 
-    print("  Running TAXSIM...")
-    ts_df, ts_ms = run_taxsim(df, year)
+    arrays = {
+        "cosilico": model_arrays(cos_df),
+        "policyengine": model_arrays(pe_df),
+        "taxsim": model_arrays(ts_df),
+    }
+    weights = df["weight"].to_numpy(dtype=np.float64, copy=False)
 
     # Build comparison for each variable
-    results = {}
-    weights = df["weight"].values
-
-    for var in variables:
-        cos_col = var
-        if var == "non_refundable_ctc":
-            cos_col = "non_refundable_ctc"
-        elif var == "refundable_ctc":
-            cos_col = "refundable_ctc"
-
-        results[var] = RecordComparison(
+    results = {
+        var: RecordComparison(
             variable=var,
-            n_records=len(df),
-            cosilico=cos_df[cos_col].values if cos_col in cos_df.columns else np.zeros(len(df)),
-            policyengine=pe_df[var].values if var in pe_df.columns else np.zeros(len(df)),
-            taxsim=ts_df[var].values if var in ts_df.columns else np.zeros(len(df)),
-            taxcalc=np.zeros(len(df)),  # TODO: add Tax-Calculator
+            n_records=n_records,
+            cosilico=arrays["cosilico"][var],
+            policyengine=arrays["policyengine"][var],
+            taxsim=arrays["taxsim"][var],
+            taxcalc=zeros,  # TODO: add Tax-Calculator
             weights=weights,
             cosilico_ms=cos_ms,
             policyengine_ms=pe_ms,
             taxsim_ms=ts_ms,
             taxcalc_ms=0,
         )
+        for var in variables
+    }
 
     return results
 
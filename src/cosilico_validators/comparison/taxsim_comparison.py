@@ -8,23 +8,64 @@ TAXSIM API: https://taxsim.nber.org/taxsim35/
 """
 
 import csv
+import functools
+import hashlib
+import heapq
 import io
+import json
+import logging
+import multiprocessing
+import os
 import sys
-import time
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
+from itertools import product
 from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, List, Optional, Tuple
-import urllib.request
-import urllib.error
-import tempfile
-import subprocess
+
+import requests
+from requests.adapters import HTTPAdapter
+from rich.progress import Progress
+from urllib3.util.retry import Retry
+
+from cosilico_validators.comparison.pe_situations import combine_pe_situations
+
+logger = logging.getLogger(__name__)
 
 # Add parent for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Persistent result caches, keyed on input hashes
+PE_CACHE_DIR = Path.home() / ".cache" / "cosilico-validators" / "pe"
+TAXSIM_CACHE_DIR = Path.home() / ".cache" / "cosilico-validators" / "taxsim-api"
+
+TAXSIM_URL = "https://taxsim.nber.org/taxsim35/redirect.cgi"
+
+# Cases per TAXSIM submission and concurrent submissions (see query_taxsim_cases)
+TAXSIM_CHUNK_SIZE = 20
+TAXSIM_MAX_WORKERS = 8
+
+# Shared HTTPS session: keep-alive connection pool plus retry with backoff
+# on transient server errors (POST included, as TAXSIM queries are pure).
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=TAXSIM_MAX_WORKERS,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=None,
+        ),
+    ),
+)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaxCase:
     """A test case for tax calculation comparison."""
 
@@ -63,7 +104,7 @@ class TaxCase:
     otheritem: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TaxSimResult:
     """Results from TAXSIM API."""
 
@@ -95,7 +136,37 @@ class TaxSimResult:
     v28_fica: float = 0.0
 
 
-@dataclass
+# TAXSIM output column for each TaxSimResult field, in field order.
+_TAXSIM_RESULT_COLUMNS = (
+    "taxsimid",
+    "year",
+    "state",
+    "fiitax",
+    "siitax",
+    "fica",
+    "frate",
+    "srate",
+    "ficar",
+    "v10",
+    "v11",
+    "v12",
+    "v13",
+    "v14",
+    "v15",
+    "v16",
+    "v17",
+    "v18",
+    "v19",
+    "v22",
+    "v23",
+    "v25",
+    "v26",
+    "v27",
+    "v28",
+)
+
+
+@dataclass(slots=True)
 class PolicyEngineResult:
     """Results from PolicyEngine-US."""
 
@@ -112,7 +183,7 @@ class PolicyEngineResult:
     amt: float = 0.0  # Alternative Minimum Tax
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Comparison between TAXSIM and PolicyEngine."""
 
@@ -122,151 +193,132 @@ class ComparisonResult:
     errors: List[str] = field(default_factory=list)
 
 
+def _child_ages(n_kids: int, ages: Tuple[int, int, int]) -> Dict[str, int]:
+    """age1-age3 keyword arguments for the first ``n_kids`` of ``ages``."""
+    return {f"age{k + 1}": age if k < n_kids else 0 for k, age in enumerate(ages)}
+
+
 def generate_test_cases() -> List[TaxCase]:
     """Generate comprehensive test scenarios."""
-    cases = []
-
     # 1. Single filers at various income levels
-    for income in [15000, 25000, 40000, 60000, 80000, 120000, 200000, 400000]:
-        cases.append(
-            TaxCase(
-                name=f"Single ${income:,}",
-                mstat=1,
-                page=35,
-                pwages=income,
-            )
-        )
+    single = [
+        TaxCase(name=f"Single ${income:,}", mstat=1, page=35, pwages=income)
+        for income in [15000, 25000, 40000, 60000, 80000, 120000, 200000, 400000]
+    ]
 
     # 2. Married filing jointly at various income levels
-    for income in [40000, 80000, 120000, 200000, 400000]:
-        cases.append(
-            TaxCase(
-                name=f"MFJ ${income:,}",
-                mstat=2,
-                page=40,
-                pwages=int(income * 0.6),
-                sage=38,
-                swages=int(income * 0.4),
-            )
+    mfj = [
+        TaxCase(
+            name=f"MFJ ${income:,}",
+            mstat=2,
+            page=40,
+            pwages=int(income * 0.6),
+            sage=38,
+            swages=int(income * 0.4),
         )
+        for income in [40000, 80000, 120000, 200000, 400000]
+    ]
 
     # 3. EITC-eligible scenarios (Head of Household with children)
     # Use age1-age3 for specific dependent ages (TAXSIM preferred method)
-    for income in [15000, 20000, 30000, 40000, 50000]:
-        for n_kids in [1, 2, 3]:
-            case = TaxCase(
-                name=f"HoH ${income:,} + {n_kids} kids",
-                mstat=3,  # Head of household
-                page=32,
-                pwages=income,
-                depx=n_kids,
-            )
-            # Add child ages (8, 10, 12 for EITC/CTC eligibility)
-            if n_kids >= 1:
-                case.age1 = 8
-            if n_kids >= 2:
-                case.age2 = 10
-            if n_kids >= 3:
-                case.age3 = 12
-            cases.append(case)
+    # Child ages 8, 10, 12 for EITC/CTC eligibility
+    hoh_kids = [
+        TaxCase(
+            name=f"HoH ${income:,} + {n_kids} kids",
+            mstat=3,  # Head of household
+            page=32,
+            pwages=income,
+            depx=n_kids,
+            **_child_ages(n_kids, (8, 10, 12)),
+        )
+        for income, n_kids in product([15000, 20000, 30000, 40000, 50000], [1, 2, 3])
+    ]
 
     # 4. MFJ with children (CTC scenarios)
-    for income in [50000, 75000, 100000, 150000, 200000, 400000, 500000]:
-        for n_kids in [1, 2, 3]:
-            case = TaxCase(
-                name=f"MFJ ${income:,} + {n_kids} kids",
-                mstat=2,
-                page=35,
-                pwages=int(income * 0.6),
-                sage=33,
-                swages=int(income * 0.4),
-                depx=n_kids,
-            )
-            if n_kids >= 1:
-                case.age1 = 6
-            if n_kids >= 2:
-                case.age2 = 9
-            if n_kids >= 3:
-                case.age3 = 14
-            cases.append(case)
+    mfj_kids = [
+        TaxCase(
+            name=f"MFJ ${income:,} + {n_kids} kids",
+            mstat=2,
+            page=35,
+            pwages=int(income * 0.6),
+            sage=33,
+            swages=int(income * 0.4),
+            depx=n_kids,
+            **_child_ages(n_kids, (6, 9, 14)),
+        )
+        for income, n_kids in product(
+            [50000, 75000, 100000, 150000, 200000, 400000, 500000], [1, 2, 3]
+        )
+    ]
 
     # 5. Self-employment income
-    for income in [30000, 60000, 100000, 150000, 200000]:
-        cases.append(
-            TaxCase(
-                name=f"Self-employed ${income:,}",
-                mstat=1,
-                page=45,
-                psemp=income,
-            )
-        )
+    self_employed = [
+        TaxCase(name=f"Self-employed ${income:,}", mstat=1, page=45, psemp=income)
+        for income in [30000, 60000, 100000, 150000, 200000]
+    ]
 
     # 6. Mixed wages + self-employment
-    for wage_income in [40000, 80000]:
-        for se_income in [20000, 50000]:
-            cases.append(
-                TaxCase(
-                    name=f"Wages ${wage_income:,} + SE ${se_income:,}",
-                    mstat=1,
-                    page=40,
-                    pwages=wage_income,
-                    psemp=se_income,
-                )
-            )
+    wages_se = [
+        TaxCase(
+            name=f"Wages ${wage_income:,} + SE ${se_income:,}",
+            mstat=1,
+            page=40,
+            pwages=wage_income,
+            psemp=se_income,
+        )
+        for wage_income, se_income in product([40000, 80000], [20000, 50000])
+    ]
 
     # 7. Investment income scenarios
-    for wage_income in [50000, 100000]:
-        for dividend_income in [5000, 20000, 50000]:
-            cases.append(
-                TaxCase(
-                    name=f"Wages ${wage_income:,} + Div ${dividend_income:,}",
-                    mstat=1,
-                    page=45,
-                    pwages=wage_income,
-                    dividends=dividend_income,
-                )
-            )
+    dividends = [
+        TaxCase(
+            name=f"Wages ${wage_income:,} + Div ${dividend_income:,}",
+            mstat=1,
+            page=45,
+            pwages=wage_income,
+            dividends=dividend_income,
+        )
+        for wage_income, dividend_income in product([50000, 100000], [5000, 20000, 50000])
+    ]
 
     # 8. Capital gains scenarios
-    for wage_income in [60000, 120000]:
-        for ltcg in [10000, 50000, 100000]:
-            cases.append(
-                TaxCase(
-                    name=f"Wages ${wage_income:,} + LTCG ${ltcg:,}",
-                    mstat=1,
-                    page=50,
-                    pwages=wage_income,
-                    ltcg=ltcg,
-                )
-            )
+    capital_gains = [
+        TaxCase(
+            name=f"Wages ${wage_income:,} + LTCG ${ltcg:,}",
+            mstat=1,
+            page=50,
+            pwages=wage_income,
+            ltcg=ltcg,
+        )
+        for wage_income, ltcg in product([60000, 120000], [10000, 50000, 100000])
+    ]
 
     # 9. High income with itemized deductions
-    for income in [200000, 400000]:
-        cases.append(
-            TaxCase(
-                name=f"MFJ ${income:,} itemized",
-                mstat=2,
-                page=45,
-                pwages=int(income * 0.6),
-                sage=43,
-                swages=int(income * 0.4),
-                proptax=15000,
-                mortgage=20000,
-            )
+    itemized = [
+        TaxCase(
+            name=f"MFJ ${income:,} itemized",
+            mstat=2,
+            page=45,
+            pwages=int(income * 0.6),
+            sage=43,
+            swages=int(income * 0.4),
+            proptax=15000,
+            mortgage=20000,
         )
+        for income in [200000, 400000]
+    ]
 
     # 10. Social Security recipients
-    for ss_income in [20000, 35000, 50000]:
-        for other_income in [0, 15000, 30000]:
-            cases.append(
-                TaxCase(
-                    name=f"SS ${ss_income:,} + Other ${other_income:,}",
-                    mstat=1,
-                    page=68,
-                    gssi=ss_income,
-                    pwages=other_income,
-                )
-            )
+    social_security = [
+        TaxCase(
+            name=f"SS ${ss_income:,} + Other ${other_income:,}",
+            mstat=1,
+            page=68,
+            gssi=ss_income,
+            pwages=other_income,
+        )
+        for ss_income, other_income in product([20000, 35000, 50000], [0, 15000, 30000])
+    ]
 
     # 11. AMT-triggering scenarios (high income with large itemized deductions)
     # AMT is triggered when tentative minimum tax > regular tax
@@ -275,54 +327,109 @@ def generate_test_cases() -> List[TaxCase]:
     # so fewer taxpayers are subject to AMT
 
     # High-income with large SALT (capped at $10k for regular tax, but fully added back for AMT)
-    for income in [500000, 750000, 1000000]:
-        cases.append(
-            TaxCase(
-                name=f"AMT - High income ${income:,}",
-                mstat=2,  # Joint
-                page=50,
-                pwages=int(income * 0.6),
-                sage=48,
-                swages=int(income * 0.4),
-                proptax=50000,  # High SALT
-                mortgage=30000,
-            )
+    amt_joint = [
+        TaxCase(
+            name=f"AMT - High income ${income:,}",
+            mstat=2,  # Joint
+            page=50,
+            pwages=int(income * 0.6),
+            sage=48,
+            swages=int(income * 0.4),
+            proptax=50000,  # High SALT
+            mortgage=30000,
         )
+        for income in [500000, 750000, 1000000]
+    ]
 
     # Single high earner - more likely to trigger AMT
-    for income in [400000, 600000, 800000]:
-        cases.append(
-            TaxCase(
-                name=f"AMT - Single high ${income:,}",
-                mstat=1,
-                page=45,
-                pwages=income,
-                proptax=30000,
-                mortgage=20000,
-            )
+    amt_single = [
+        TaxCase(
+            name=f"AMT - Single high ${income:,}",
+            mstat=1,
+            page=45,
+            pwages=income,
+            proptax=30000,
+            mortgage=20000,
         )
+        for income in [400000, 600000, 800000]
+    ]
 
     # Exemption phaseout range scenarios
     # Joint phaseout starts at $1,218,700 for 2024, Single at $609,350
-    for income in [1200000, 1500000, 2000000]:
-        cases.append(
-            TaxCase(
-                name=f"AMT phaseout - Joint ${income:,}",
-                mstat=2,
-                page=55,
-                pwages=int(income * 0.6),
-                sage=53,
-                swages=int(income * 0.4),
-                proptax=40000,
-            )
+    amt_phaseout = [
+        TaxCase(
+            name=f"AMT phaseout - Joint ${income:,}",
+            mstat=2,
+            page=55,
+            pwages=int(income * 0.6),
+            sage=53,
+            swages=int(income * 0.4),
+            proptax=40000,
         )
+        for income in [1200000, 1500000, 2000000]
+    ]
 
-    return cases
+    return [
+        *single,
+        *mfj,
+        *hoh_kids,
+        *mfj_kids,
+        *self_employed,
+        *wages_se,
+        *dividends,
+        *capital_gains,
+        *itemized,
+        *social_security,
+        *amt_joint,
+        *amt_single,
+        *amt_phaseout,
+    ]
 
 
-def cases_to_taxsim_csv(cases: List[TaxCase]) -> str:
-    """Convert test cases to TAXSIM CSV format."""
-    output = io.StringIO()
+@functools.lru_cache(maxsize=None)
+def _policyengine_version() -> str:
+    """Installed policyengine-us version (part of the PE cache key)."""
+    from importlib.metadata import version
+
+    return version("policyengine-us")
+
+
+def _case_cache_key(case: TaxCase) -> str:
+    """Stable hash of a case's tax inputs plus the PolicyEngine version.
+
+    The case name is only a label, so it is left out of the key.
+    """
+    inputs = asdict(case)
+    inputs.pop("name")
+    payload = json.dumps(inputs, sort_keys=True) + _policyengine_version()
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _load_cached(path: Path):
+    """Load a JSON cache entry, or None if missing or unreadable."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached(path: Path, data) -> None:
+    """Write a JSON cache entry atomically (safe across worker processes)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data))
+    tmp_path.replace(path)
+
+
+def cases_to_taxsim_csv(cases: List[TaxCase], start_id: int = 1) -> bytes:
+    """Convert test cases to TAXSIM CSV format.
+
+    Rows are numbered from ``start_id`` so shards of a larger case list keep
+    their global taxsimid. The CSV is encoded straight into a byte buffer,
+    ready to upload without an intermediate str.
+    """
+    buffer = io.BytesIO()
+    output = io.TextIOWrapper(buffer, encoding="utf-8", newline="", write_through=True)
     writer = csv.writer(output)
 
     # Header row - using age1-age3 for dependent ages (TAXSIM preferred)
@@ -356,7 +463,7 @@ def cases_to_taxsim_csv(cases: List[TaxCase]) -> str:
     ]
     writer.writerow(headers)
 
-    for i, case in enumerate(cases, start=1):
+    for i, case in enumerate(cases, start=start_id):
         row = [
             i,  # taxsimid
             case.year,
@@ -387,261 +494,412 @@ def cases_to_taxsim_csv(cases: List[TaxCase]) -> str:
         ]
         writer.writerow(row)
 
-    return output.getvalue()
+    output.detach()
+    return buffer.getvalue()
 
 
-def query_taxsim(csv_data: str, max_retries: int = 3) -> List[TaxSimResult]:
+def query_taxsim(csv_data: bytes, use_cache: bool = True) -> List[TaxSimResult]:
     """Send CSV data to TAXSIM API and parse results.
 
-    Uses curl for multipart form upload per TAXSIM documentation:
+    Posts the CSV as a multipart form upload per TAXSIM documentation:
     https://taxsim.nber.org/taxsim35/low-level-remote.html
-    """
-    url = "https://taxsim.nber.org/taxsim35/redirect.cgi"
-
-    for attempt in range(max_retries):
-        try:
-            # Write CSV to temp file
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".csv", delete=False
-            ) as f:
-                f.write(csv_data)
-                temp_path = f.name
+    The pooled session keeps the HTTPS connection alive and retries
+    transient failures with backoff.
 
-            try:
-                # Use curl for multipart form upload
-                result = subprocess.run(
-                    [
-                        "curl",
-                        "-s",  # Silent
-                        "-F",
-                        f"txpydata.csv=@{temp_path}",
-                        url,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=120,
-                )
-
-                if result.returncode != 0:
-                    print(f"curl error: {result.stderr}")
-                    continue
-
-                result_text = result.stdout
+    Non-empty results are cached on disk under TAXSIM_CACHE_DIR, keyed on a
+    hash of the CSV body.
+    """
+    cache_path = (
+        TAXSIM_CACHE_DIR
+        / f"{hashlib.blake2b(csv_data, digest_size=16).hexdigest()}.json"
+    )
+    if use_cache:
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            return [TaxSimResult(**r) for r in cached]
 
-            finally:
-                # Clean up temp file
-                Path(temp_path).unlink(missing_ok=True)
-
-            # Parse CSV response
-            results = []
-
-            # TAXSIM returns space-separated or comma-separated values
-            # First, try to detect the format
-            lines = result_text.strip().split("\n")
-            if not lines:
-                print("Empty response from TAXSIM")
-                continue
-
-            # Check if it's an error response
-            if "error" in lines[0].lower() or "<html" in lines[0].lower():
-                print(f"TAXSIM error response: {lines[0][:200]}")
-                continue
-
-            # Parse the response - TAXSIM may return space or comma separated
-            reader = csv.DictReader(io.StringIO(result_text))
-
-            for row in reader:
-                try:
-                    result = TaxSimResult(
-                        taxsim_id=int(float(row.get("taxsimid", 0))),
-                        year=int(float(row.get("year", 0))),
-                        state=int(float(row.get("state", 0))),
-                        fiitax=float(row.get("fiitax", 0)),
-                        siitax=float(row.get("siitax", 0)),
-                        fica=float(row.get("fica", 0)),
-                        frate=float(row.get("frate", 0)),
-                        srate=float(row.get("srate", 0)),
-                        ficar=float(row.get("ficar", 0)),
-                        v10_agi=float(row.get("v10", 0)),
-                        v11_ui_agi=float(row.get("v11", 0)),
-                        v12_ss_agi=float(row.get("v12", 0)),
-                        v13_zero_bracket=float(row.get("v13", 0)),
-                        v14_exemptions=float(row.get("v14", 0)),
-                        v15_exemption_phaseout=float(row.get("v15", 0)),
-                        v16_deductions=float(row.get("v16", 0)),
-                        v17_deduction_phaseout=float(row.get("v17", 0)),
-                        v18_taxable_income=float(row.get("v18", 0)),
-                        v19_tax_regular=float(row.get("v19", 0)),
-                        v22_ctc=float(row.get("v22", 0)),
-                        v23_ctc_refundable=float(row.get("v23", 0)),
-                        v25_eitc=float(row.get("v25", 0)),
-                        v26_amt=float(row.get("v26", 0)),
-                        v27_fed_tax_before_credits=float(row.get("v27", 0)),
-                        v28_fica=float(row.get("v28", 0)),
-                    )
-                    results.append(result)
-                except (ValueError, KeyError) as e:
-                    print(f"Error parsing TAXSIM row: {e}")
-                    continue
-
-            return results
-
-        except subprocess.TimeoutExpired:
-            print(f"TAXSIM request timeout (attempt {attempt + 1})")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+    try:
+        response = _SESSION.post(
+            TAXSIM_URL,
+            files={"txpydata.csv": ("txpydata.csv", csv_data, "text/csv")},
+            timeout=120,
+        )
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.warning("TAXSIM API error: %s", e)
+        return []
+
+    result_text = response.text
+
+    # Parse CSV response
+    results = []
+
+    # TAXSIM returns space-separated or comma-separated values
+    # First, try to detect the format
+    lines = result_text.strip().split("\n")
+    if not lines or not lines[0]:
+        logger.warning("Empty response from TAXSIM")
+        return []
+
+    # Check if it's an error response
+    if "error" in lines[0].lower() or "<html" in lines[0].lower():
+        logger.warning("TAXSIM error response: %s", lines[0][:200])
+        return []
+
+    # Parse the response - TAXSIM may return space or comma separated.
+    # Resolve each TaxSimResult field to a column position once from the
+    # header, then build every row positionally; absent columns read as 0.
+    rows = csv.reader(io.StringIO(result_text))
+    header = {name.strip(): i for i, name in enumerate(next(rows))}
+    positions = [header.get(column) for column in _TAXSIM_RESULT_COLUMNS]
+
+    for row in rows:
+        if not row:
             continue
-        except Exception as e:
-            print(f"TAXSIM API error (attempt {attempt + 1}): {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+        try:
+            vals = [float(v) if v else 0.0 for v in row]
+            taxsim_id, year, state, *rest = (
+                vals[i] if i is not None else 0.0 for i in positions
+            )
+            results.append(TaxSimResult(int(taxsim_id), int(year), int(state), *rest))
+        except (ValueError, IndexError) as e:
+            logger.warning("Error parsing TAXSIM row: %s", e)
             continue
 
-    return []
+    if use_cache and results:
+        _write_cached(cache_path, [asdict(r) for r in results])
 
+    return results
 
-def run_policyengine(case: TaxCase) -> PolicyEngineResult:
-    """Run PolicyEngine-US calculation for a test case."""
-    try:
-        from policyengine_us import Simulation
-    except ImportError:
-        print("PolicyEngine-US not installed. Install with: pip install policyengine-us")
-        return PolicyEngineResult()
 
-    # Build situation
-    people = {}
-    tax_unit_members = []
+def query_taxsim_cases(
+    cases: List[TaxCase],
+    chunk_size: int = TAXSIM_CHUNK_SIZE,
+    max_workers: int = TAXSIM_MAX_WORKERS,
+) -> List[TaxSimResult]:
+    """Query TAXSIM for all cases as concurrent shards of ``chunk_size``.
 
-    # Primary taxpayer
-    primary_data = {
-        "age": {case.year: case.page},
-        "employment_income": {case.year: case.pwages},
-        "self_employment_income": {case.year: case.psemp},
-        "dividend_income": {case.year: case.dividends},
-        "interest_income": {case.year: case.intrec},
-        "short_term_capital_gains": {case.year: case.stcg},
-        "long_term_capital_gains": {case.year: case.ltcg},
-        "taxable_pension_income": {case.year: case.pensions},
-        "social_security": {case.year: case.gssi},
-        "unemployment_compensation": {case.year: case.pui},
-    }
+    Shards share the pooled session, so their round trips overlap, and a
+    retry only re-sends one shard. taxsimid stays the 1-based index into
+    ``cases``.
+    """
+    chunks = [
+        cases_to_taxsim_csv(cases[i:i + chunk_size], start_id=i + 1)
+        for i in range(0, len(cases), chunk_size)
+    ]
 
-    # Add itemized deductions to primary taxpayer (person-level variables)
-    if case.proptax > 0:
-        primary_data["real_estate_taxes"] = {case.year: case.proptax}
-    if case.mortgage > 0:
-        primary_data["mortgage_interest"] = {case.year: case.mortgage}
-    if case.otheritem > 0:
-        primary_data["charitable_cash_donations"] = {case.year: case.otheritem}
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for partial in executor.map(query_taxsim, chunks):
+            results.extend(partial)
+    return results
+
+
+# PolicyEngine person variable -> TaxCase field, for each person role
+_PE_PRIMARY_INPUTS = (
+    ("age", "page"),
+    ("employment_income", "pwages"),
+    ("self_employment_income", "psemp"),
+    ("dividend_income", "dividends"),
+    ("interest_income", "intrec"),
+    ("short_term_capital_gains", "stcg"),
+    ("long_term_capital_gains", "ltcg"),
+    ("taxable_pension_income", "pensions"),
+    ("social_security", "gssi"),
+    ("unemployment_compensation", "pui"),
+)
+# Itemized deductions (person-level), only set when positive
+_PE_ITEMIZED_INPUTS = (
+    ("real_estate_taxes", "proptax"),
+    ("mortgage_interest", "mortgage"),
+    ("charitable_cash_donations", "otheritem"),
+)
+_PE_SPOUSE_INPUTS = (
+    ("age", "sage"),
+    ("employment_income", "swages"),
+    ("self_employment_income", "ssemp"),
+)
+
+# TAXSIM mstat -> PolicyEngine filing_status (anything else files SINGLE)
+_FILING_STATUS_MAP = {
+    1: "SINGLE",
+    2: "JOINT",
+    3: "HEAD_OF_HOUSEHOLD",
+    6: "SEPARATE",
+}
+
+
+def _build_pe_situation(case: TaxCase) -> dict:
+    """Build a single-tax-unit PolicyEngine situation for a test case."""
+    year = case.year
 
-    people["primary"] = primary_data
-    tax_unit_members.append("primary")
+    # Primary taxpayer
+    primary_data = {var: {year: getattr(case, attr)} for var, attr in _PE_PRIMARY_INPUTS}
+    primary_data.update(
+        (var, {year: value})
+        for var, attr in _PE_ITEMIZED_INPUTS
+        if (value := getattr(case, attr)) > 0
+    )
+    people = {"primary": primary_data}
 
     # Spouse (if MFJ)
     if case.mstat == 2 and case.sage > 0:
-        people["spouse"] = {
-            "age": {case.year: case.sage},
-            "employment_income": {case.year: case.swages},
-            "self_employment_income": {case.year: case.ssemp},
-        }
-        tax_unit_members.append("spouse")
+        people["spouse"] = {var: {year: getattr(case, attr)} for var, attr in _PE_SPOUSE_INPUTS}
 
     # Children - use specific ages from age1, age2, age3
-    child_ages = [a for a in [case.age1, case.age2, case.age3] if a > 0]
-    for i, age in enumerate(child_ages):
-        child_id = f"child_{i}"
-        people[child_id] = {
-            "age": {case.year: age},
-        }
-        tax_unit_members.append(child_id)
-
-    # Filing status mapping
-    filing_status_map = {
-        1: "SINGLE",
-        2: "JOINT",
-        3: "HEAD_OF_HOUSEHOLD",
-        6: "SEPARATE",
-    }
-    filing_status = filing_status_map.get(case.mstat, "SINGLE")
+    child_ages = [a for a in (case.age1, case.age2, case.age3) if a > 0]
+    people.update((f"child_{i}", {"age": {year: age}}) for i, age in enumerate(child_ages))
 
-    # Build tax unit
-    tax_unit = {
-        "members": tax_unit_members,
-        "filing_status": {case.year: filing_status},
-    }
+    tax_unit_members = list(people)
 
-    situation = {
+    return {
         "people": people,
-        "tax_units": {"tax_unit": tax_unit},
+        "tax_units": {
+            "tax_unit": {
+                "members": tax_unit_members,
+                "filing_status": {year: _FILING_STATUS_MAP.get(case.mstat, "SINGLE")},
+            }
+        },
         "households": {
             "household": {
                 "members": tax_unit_members,
-                "state_code": {case.year: "TX"},  # No state income tax
+                "state_code": {year: "TX"},  # No state income tax
             }
         },
     }
 
+
+# PolicyEngineResult field -> PolicyEngine variable. The simulation caches
+# every computed variable, so upstream nodes (AGI, credits) shared by later
+# outputs are only evaluated once across these calls.
+_PE_OUTPUT_VARIABLES = (
+    ("adjusted_gross_income", "adjusted_gross_income"),
+    ("taxable_income", "taxable_income"),
+    ("income_tax_before_credits", "income_tax_before_credits"),
+    ("income_tax", "income_tax"),
+    ("eitc", "eitc"),
+    ("ctc", "ctc"),
+    ("refundable_ctc", "refundable_ctc"),
+    ("employee_social_security_tax", "employee_social_security_tax"),
+    ("self_employment_tax", "self_employment_tax"),
+)
+_PE_AMT_VARIABLES = (
+    ("amt_income", "alternative_minimum_taxable_income"),
+    ("amt", "alternative_minimum_tax"),
+)
+
+
+def _pe_results_from_sim(sim, year: int, primary_idx) -> List[PolicyEngineResult]:
+    """Extract one PolicyEngineResult per tax unit from a Simulation.
+
+    Group-level variables have one value per unit; person-level ones are
+    read from each unit's primary filer.
+    """
+    import numpy as np
+
+    primary_idx = np.asarray(primary_idx)
+
+    def values(variable: str) -> np.ndarray:
+        result = np.asarray(sim.calculate(variable, year))
+        if sim.tax_benefit_system.variables[variable].entity.key == "person":
+            return result[primary_idx]
+        return result
+
+    columns = {field: values(variable) for field, variable in _PE_OUTPUT_VARIABLES}
+
+    # AMT variables may not be implemented in all PolicyEngine-US versions
+    columns.update(
+        (field, values(variable))
+        for field, variable in _PE_AMT_VARIABLES
+        if variable in sim.tax_benefit_system.variables
+    )
+
+    return [
+        PolicyEngineResult(**{name: float(column[i]) for name, column in columns.items()})
+        for i in range(len(primary_idx))
+    ]
+
+
+def run_policyengine(case: TaxCase, use_cache: bool = True) -> PolicyEngineResult:
+    """Run PolicyEngine-US calculation for a test case.
+
+    Successful results are cached on disk under PE_CACHE_DIR, keyed on the
+    case inputs and the installed policyengine-us version.
+    """
     try:
-        sim = Simulation(situation=situation)
-
-        result = PolicyEngineResult(
-            adjusted_gross_income=float(
-                sim.calculate("adjusted_gross_income", case.year)[0]
-            ),
-            taxable_income=float(sim.calculate("taxable_income", case.year)[0]),
-            income_tax_before_credits=float(
-                sim.calculate("income_tax_before_credits", case.year)[0]
-            ),
-            income_tax=float(sim.calculate("income_tax", case.year)[0]),
-            eitc=float(sim.calculate("eitc", case.year)[0]),
-            ctc=float(sim.calculate("ctc", case.year)[0]),
-            refundable_ctc=float(sim.calculate("refundable_ctc", case.year)[0]),
-            employee_social_security_tax=float(
-                sim.calculate("employee_social_security_tax", case.year)[0]
-            ),
-            self_employment_tax=float(
-                sim.calculate("self_employment_tax", case.year)[0]
-            ),
-        )
+        from policyengine_us import Simulation
+    except ImportError:
+        logger.warning("PolicyEngine-US not installed. Install with: pip install policyengine-us")
+        return PolicyEngineResult()
 
-        # Try to get AMT variables (may not exist in all PE versions)
-        try:
-            result.amt_income = float(
-                sim.calculate("alternative_minimum_taxable_income", case.year)[0]
-            )
-            result.amt = float(
-                sim.calculate("alternative_minimum_tax", case.year)[0]
-            )
-        except Exception:
-            # AMT variables may not be implemented in PolicyEngine-US yet
-            pass
+    cache_path = PE_CACHE_DIR / f"{_case_cache_key(case)}.json"
+    if use_cache:
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            return PolicyEngineResult(**cached)
+
+    try:
+        sim = Simulation(situation=_build_pe_situation(case))
+        result = _pe_results_from_sim(sim, case.year, [0])[0]
+
+        if use_cache:
+            _write_cached(cache_path, asdict(result))
 
         return result
 
     except Exception as e:
-        print(f"PolicyEngine error for {case.name}: {e}")
+        logger.warning("PolicyEngine error for %s: %s", case.name, e)
         return PolicyEngineResult()
 
 
+def run_policyengine_batch(
+    cases: List[TaxCase], use_cache: bool = True
+) -> List[PolicyEngineResult]:
+    """Run PolicyEngine-US for many cases with one Simulation per tax year.
+
+    All uncached cases of a year go into a single multi-unit situation, so
+    the tax-benefit system is loaded and the computation graph traversed
+    once rather than per case. Cases of any household shape (filing status,
+    spouse, number of children) share that Simulation, since each keeps its
+    own group entities. If the batch Simulation fails, its cases are
+    retried one by one with run_policyengine.
+
+    Cases that differ only by name are simulated once and share a result.
+    """
+    try:
+        from policyengine_us import Simulation
+    except ImportError:
+        logger.warning("PolicyEngine-US not installed. Install with: pip install policyengine-us")
+        return [PolicyEngineResult() for _ in cases]
+
+    # First case seen for each distinct set of tax inputs
+    representatives: Dict[TaxCase, TaxCase] = {}
+    for case in cases:
+        representatives.setdefault(replace(case, name=""), case)
+    all_cases, cases = cases, list(representatives.values())
+
+    results: List[Optional[PolicyEngineResult]] = [None] * len(cases)
+    cache_paths = [PE_CACHE_DIR / f"{_case_cache_key(case)}.json" for case in cases]
+    if use_cache:
+        for i, cache_path in enumerate(cache_paths):
+            cached = _load_cached(cache_path)
+            if cached is not None:
+                results[i] = PolicyEngineResult(**cached)
+
+    pending = [i for i, result in enumerate(results) if result is None]
+    for year in sorted({cases[i].year for i in pending}):
+        batch = [i for i in pending if cases[i].year == year]
+        situation, primary_idx = combine_pe_situations(
+            [_build_pe_situation(cases[i]) for i in batch]
+        )
+        try:
+            sim = Simulation(situation=situation)
+            batch_results = _pe_results_from_sim(sim, year, primary_idx)
+        except Exception as e:
+            logger.warning("PolicyEngine batch error for %s: %s; running cases individually", year, e)
+            batch_results = [run_policyengine(cases[i], use_cache) for i in batch]
+        else:
+            if use_cache:
+                for i, result in zip(batch, batch_results):
+                    _write_cached(cache_paths[i], asdict(result))
+
+        for i, result in zip(batch, batch_results):
+            results[i] = result
+
+    by_inputs = dict(zip(representatives, results))
+    return [by_inputs[replace(case, name="")] for case in all_cases]
+
+
+class _ForwardToLogger(logging.Handler):
+    """Re-dispatch a worker's log record to the same-named logger here."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker_logging(queue, level: int) -> None:
+    """Send a worker process's log records to the parent through ``queue``."""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(queue)]
+    root.setLevel(level)
+
+
+def run_policyengine_all(
+    cases: List[TaxCase], batch_size: Optional[int] = None
+) -> List[PolicyEngineResult]:
+    """Run PolicyEngine for every case, in parallel across processes.
+
+    Cases are split into batches (by default one per CPU), each run as a
+    single multi-unit Simulation by run_policyengine_batch, and the batches
+    are spread over a ProcessPoolExecutor. Set COSILICO_SERIAL=1 to run
+    in-process (e.g. for debugging).
+
+    Workers log through a queue that the parent drains into its own
+    handlers, so only the parent writes to the terminal, where it also
+    shows a progress bar.
+    """
+    if not cases:
+        return []
+
+    workers = os.cpu_count() or 1
+    if batch_size is None:
+        batch_size = -(-len(cases) // workers)  # ceil division
+    batches = [cases[i:i + batch_size] for i in range(0, len(cases), batch_size)]
+    batch_results: List[List[PolicyEngineResult]] = [[] for _ in batches]
+
+    with Progress(transient=True) as progress:
+        task = progress.add_task("PolicyEngine", total=len(cases))
+
+        if os.environ.get("COSILICO_SERIAL") == "1":
+            for k, batch in enumerate(batches):
+                batch_results[k] = run_policyengine_batch(batch)
+                progress.advance(task, len(batch))
+        else:
+            # Spawn, not fork: the progress bar and log listener threads are
+            # already running and a forked child could inherit their held locks
+            ctx = multiprocessing.get_context("spawn")
+            log_queue = ctx.Queue()
+            listener = QueueListener(log_queue, _ForwardToLogger())
+            listener.start()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=ctx,
+                    initializer=_init_worker_logging,
+                    initargs=(log_queue, logger.getEffectiveLevel()),
+                ) as executor:
+                    futures = {
+                        executor.submit(run_policyengine_batch, batch): k
+                        for k, batch in enumerate(batches)
+                    }
+                    for future in as_completed(futures):
+                        k = futures[future]
+                        batch_results[k] = future.result()
+                        progress.advance(task, len(batches[k]))
+            finally:
+                listener.stop()
+
+    return [result for batch in batch_results for result in batch]
+
+
 def run_comparisons(cases: List[TaxCase]) -> List[ComparisonResult]:
     """Run all comparisons between TAXSIM and PolicyEngine."""
-    print(f"Running {len(cases)} test cases...")
+    logger.info("Running %d test cases...", len(cases))
 
-    # Query TAXSIM for all cases at once
-    print("Querying TAXSIM API...")
-    csv_data = cases_to_taxsim_csv(cases)
-    taxsim_results = query_taxsim(csv_data)
+    # Query TAXSIM in concurrent shards
+    logger.info("Querying TAXSIM API...")
+    taxsim_results = query_taxsim_cases(cases)
 
     # Index TAXSIM results by ID
     taxsim_by_id = {r.taxsim_id: r for r in taxsim_results}
 
-    # Run PolicyEngine for each case
-    print("Running PolicyEngine calculations...")
-    comparisons = []
+    # Run PolicyEngine for all cases
+    logger.info("Running PolicyEngine calculations...")
+    pe_results = run_policyengine_all(cases)
 
-    for i, case in enumerate(cases, start=1):
+    comparisons = []
+    for i, (case, pe_result) in enumerate(zip(cases, pe_results), start=1):
         taxsim_result = taxsim_by_id.get(i)
-        pe_result = run_policyengine(case)
 
         comparison = ComparisonResult(
             case=case,
@@ -654,115 +912,223 @@ def run_comparisons(cases: List[TaxCase]) -> List[ComparisonResult]:
 
         comparisons.append(comparison)
 
-        if i % 10 == 0:
-            print(f"  Processed {i}/{len(cases)} cases...")
+    logger.info("  Processed %d/%d cases", len(comparisons), len(cases))
 
     return comparisons
 
 
-def compute_comparison_stats(comparisons: List[ComparisonResult]) -> Dict:
-    """Compute comparison statistics."""
-    import numpy as np
+# Variables summarized by compute_comparison_stats, in column order
+STAT_VARIABLES = ("agi", "taxable_income", "federal_tax", "eitc", "ctc", "fica", "amti")
 
-    stats = {
-        "agi": {"diffs": [], "pe": [], "ts": []},
-        "taxable_income": {"diffs": [], "pe": [], "ts": []},
-        "federal_tax": {"diffs": [], "pe": [], "ts": []},
-        "eitc": {"diffs": [], "pe": [], "ts": []},
-        "ctc": {"diffs": [], "pe": [], "ts": []},
-        "fica": {"diffs": [], "pe": [], "ts": []},
-        "amti": {"diffs": [], "pe": [], "ts": []},
-    }
+# Per-variable summary fields and their NumPy record dtypes
+_STAT_FIELDS = (
+    ("n", "i8"),
+    ("mean_diff", "f8"),
+    ("median_diff", "f8"),
+    ("std_diff", "f8"),
+    ("mae", "f8"),
+    ("max_abs_diff", "f8"),
+    ("pe_mean", "f8"),
+    ("ts_mean", "f8"),
+    ("correlation", "f8"),
+    ("pct_exact", "f8"),
+    ("pct_within_10", "f8"),
+    ("pct_within_100", "f8"),
+)
 
-    for c in comparisons:
-        if c.taxsim is None or c.policyengine is None:
-            continue
-
-        # AGI comparison
-        stats["agi"]["pe"].append(c.policyengine.adjusted_gross_income)
-        stats["agi"]["ts"].append(c.taxsim.v10_agi)
-        stats["agi"]["diffs"].append(
-            c.policyengine.adjusted_gross_income - c.taxsim.v10_agi
-        )
 
-        # Taxable income
-        stats["taxable_income"]["pe"].append(c.policyengine.taxable_income)
-        stats["taxable_income"]["ts"].append(c.taxsim.v18_taxable_income)
-        stats["taxable_income"]["diffs"].append(
-            c.policyengine.taxable_income - c.taxsim.v18_taxable_income
-        )
+def compute_comparison_stats(comparisons: List[ComparisonResult]) -> Dict:
+    """Compute comparison statistics."""
+    import numpy as np
 
-        # Federal tax
-        stats["federal_tax"]["pe"].append(c.policyengine.income_tax)
-        stats["federal_tax"]["ts"].append(c.taxsim.fiitax)
-        stats["federal_tax"]["diffs"].append(
-            c.policyengine.income_tax - c.taxsim.fiitax
+    valid = [
+        c for c in comparisons if c.taxsim is not None and c.policyengine is not None
+    ]
+    if not valid:
+        return {}
+
+    # values[i, j] = (PolicyEngine, TAXSIM) for comparison i, variable j
+    values = np.zeros((len(valid), len(STAT_VARIABLES), 2))
+    for i, c in enumerate(valid):
+        pe, ts = c.policyengine, c.taxsim
+        values[i] = (
+            (pe.adjusted_gross_income, ts.v10_agi),
+            (pe.taxable_income, ts.v18_taxable_income),
+            (pe.income_tax, ts.fiitax),
+            (pe.eitc, ts.v25_eitc),
+            (pe.ctc, ts.v22_ctc + ts.v23_ctc_refundable),
+            (pe.employee_social_security_tax + pe.self_employment_tax, ts.fica),
+            (pe.amt_income, ts.v26_amt),
         )
 
-        # EITC
-        stats["eitc"]["pe"].append(c.policyengine.eitc)
-        stats["eitc"]["ts"].append(c.taxsim.v25_eitc)
-        stats["eitc"]["diffs"].append(c.policyengine.eitc - c.taxsim.v25_eitc)
-
-        # CTC
-        stats["ctc"]["pe"].append(c.policyengine.ctc)
-        stats["ctc"]["ts"].append(c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable)
-        stats["ctc"]["diffs"].append(
-            c.policyengine.ctc - (c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable)
+    # AMTI only counts where either side has AMT values
+    included = np.ones(values.shape[:2], dtype=bool)
+    amti = STAT_VARIABLES.index("amti")
+    included[:, amti] = (values[:, amti, 0] > 0) | (values[:, amti, 1] > 0)
+
+    counts = included.sum(axis=0)
+    cols = np.flatnonzero(counts)  # Skip variables with no comparisons
+    counts = counts[cols]
+    included = included[:, cols]
+    values = values[:, cols]
+
+    # Excluded rows are zeroed so plain sums over axis 0 reduce every
+    # variable at once; moments are taken about the mean for stability.
+    pe_vals = np.where(included, values[:, :, 0], 0.0)
+    ts_vals = np.where(included, values[:, :, 1], 0.0)
+    diffs = pe_vals - ts_vals
+    abs_diffs = np.abs(diffs)
+
+    mean_diff = diffs.sum(axis=0) / counts
+    centered = np.where(included, diffs - mean_diff, 0.0)
+    std_diff = np.sqrt((centered * centered).sum(axis=0) / counts)
+    median_diff = np.nanmedian(np.where(included, diffs, np.nan), axis=0)
+    mae = abs_diffs.sum(axis=0) / counts
+    max_abs_diff = abs_diffs.max(axis=0)
+    pe_mean = pe_vals.sum(axis=0) / counts
+    ts_mean = ts_vals.sum(axis=0) / counts
+
+    # Share of comparisons within $1 / $10 / $100, as (3, n_vars)
+    within = (abs_diffs < np.array([1.0, 10.0, 100.0])[:, None, None]) & included
+    pct_exact, pct_within_10, pct_within_100 = within.sum(axis=1) / counts * 100
+
+    pe_centered = np.where(included, pe_vals - pe_mean, 0.0)
+    ts_centered = np.where(included, ts_vals - ts_mean, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlation = (pe_centered * ts_centered).sum(axis=0) / np.sqrt(
+            (pe_centered * pe_centered).sum(axis=0)
+            * (ts_centered * ts_centered).sum(axis=0)
         )
 
-        # FICA
-        pe_fica = (
-            c.policyengine.employee_social_security_tax
-            + c.policyengine.self_employment_tax
-        )
-        stats["fica"]["pe"].append(pe_fica)
-        stats["fica"]["ts"].append(c.taxsim.fica)
-        stats["fica"]["diffs"].append(pe_fica - c.taxsim.fica)
-
-        # AMTI (only if PolicyEngine has AMT values)
-        if c.policyengine.amt_income > 0 or c.taxsim.v26_amt > 0:
-            stats["amti"]["pe"].append(c.policyengine.amt_income)
-            stats["amti"]["ts"].append(c.taxsim.v26_amt)
-            stats["amti"]["diffs"].append(
-                c.policyengine.amt_income - c.taxsim.v26_amt
-            )
+    # One record per variable, filled column-wise, then converted to plain
+    # Python scalars in a single tolist() call
+    record = np.empty(len(cols), dtype=list(_STAT_FIELDS))
+    record["n"] = counts
+    record["mean_diff"] = mean_diff
+    record["median_diff"] = median_diff
+    record["std_diff"] = std_diff
+    record["mae"] = mae
+    record["max_abs_diff"] = max_abs_diff
+    record["pe_mean"] = pe_mean
+    record["ts_mean"] = ts_mean
+    record["correlation"] = np.where(counts > 1, correlation, 0.0)
+    record["pct_exact"] = pct_exact
+    record["pct_within_10"] = pct_within_10
+    record["pct_within_100"] = pct_within_100
+
+    names = [name for name, _ in _STAT_FIELDS]
+    summary = {
+        STAT_VARIABLES[j]: dict(zip(names, row)) for j, row in zip(cols, record.tolist())
+    }
 
-    # Compute summary stats for each variable
-    summary = {}
-    for var, data in stats.items():
-        if not data["diffs"]:
-            continue
+    return summary
 
-        diffs = np.array(data["diffs"])
-        pe_vals = np.array(data["pe"])
-        ts_vals = np.array(data["ts"])
-
-        # Compute various metrics
-        summary[var] = {
-            "n": len(diffs),
-            "mean_diff": float(np.mean(diffs)),
-            "median_diff": float(np.median(diffs)),
-            "std_diff": float(np.std(diffs)),
-            "mae": float(np.mean(np.abs(diffs))),
-            "max_abs_diff": float(np.max(np.abs(diffs))),
-            "pe_mean": float(np.mean(pe_vals)),
-            "ts_mean": float(np.mean(ts_vals)),
-            "correlation": float(np.corrcoef(pe_vals, ts_vals)[0, 1])
-            if len(pe_vals) > 1
-            else 0.0,
-            "pct_exact": float(np.mean(np.abs(diffs) < 1) * 100),
-            "pct_within_10": float(np.mean(np.abs(diffs) < 10) * 100),
-            "pct_within_100": float(np.mean(np.abs(diffs) < 100) * 100),
-        }
 
-    return summary
+# Display names for STAT_VARIABLES in the dashboard
+_STAT_DISPLAY_NAMES = {
+    "agi": "AGI",
+    "taxable_income": "Taxable Income",
+    "federal_tax": "Federal Tax",
+    "eitc": "EITC",
+    "ctc": "CTC",
+    "fica": "FICA",
+    "amti": "AMTI",
+}
+
+# Dashboard table row templates (fields filled with str.format)
+_ACCURACY_ROW = (
+    "| {name} | {n} | ${mean_diff:,.0f} | ${mae:,.0f} | ${max_abs_diff:,.0f} | "
+    "{correlation:.3f} | {pct_exact:.1f}% | {pct_within_10:.1f}% | {pct_within_100:.1f}% |"
+)
+_SAMPLE_ROW = (
+    "| {name} | ${pe_tax:,.0f} | ${ts_tax:,.0f} | ${diff:,.0f} | "
+    "${pe_eitc:,.0f} | ${ts_eitc:,.0f} | ${pe_ctc:,.0f} | ${ts_ctc:,.0f} |"
+)
+_FEDERAL_TAX_ROW = (
+    "| {name} | ${pe_tax:,.0f} | ${ts_tax:,.0f} | ${diff:,.0f} | "
+    "${pe_agi:,.0f} | ${ts_agi:,.0f} |"
+)
+_EITC_ROW = (
+    "| {name} | ${pe_eitc:,.0f} | ${ts_eitc:,.0f} | ${diff:,.0f} | "
+    "${wages:,.0f} | {depx} |"
+)
+_CTC_ROW = (
+    "| {name} | ${pe_ctc:,.0f} | ${ts_ctc:,.0f} | ${ts_refund:,.0f} | "
+    "${diff:,.0f} | {depx} |"
+)
+
+# Static sections closing the dashboard
+_DASHBOARD_FOOTER = (
+    "",
+    "## Test Scenario Categories",
+    "",
+    "1. **Single filers** - Income levels $15K to $400K",
+    "2. **Married filing jointly** - Income levels $40K to $400K",
+    "3. **Head of Household with children** - EITC eligibility scenarios",
+    "4. **MFJ with children** - CTC eligibility scenarios",
+    "5. **Self-employment income** - SE tax calculations",
+    "6. **Mixed wages + self-employment** - Combined income",
+    "7. **Investment income** - Dividends and interest",
+    "8. **Capital gains** - Long-term capital gains",
+    "9. **High income itemized** - Mortgage and property tax deductions",
+    "10. **Social Security recipients** - Benefit taxation",
+    "",
+    "## Known Differences",
+    "",
+    "### TAXSIM vs PolicyEngine",
+    "",
+    "- **Dependent handling**: TAXSIM uses `depx` count and `age1-age3` for ages; "
+    "PolicyEngine models individual dependents with specific attributes",
+    "- **Head of Household**: Filing status determination may differ",
+    "- **EITC phase-out**: Minor differences in earned income calculation",
+    "- **CTC refundability**: ACTC (refundable portion) calculation differs",
+    "- **Self-employment tax**: TAXSIM may use different SE income calculation",
+    "",
+    "## Methodology",
+    "",
+    "1. Generate standardized test cases covering key scenarios",
+    "2. Submit batch to TAXSIM 35 API (https://taxsim.nber.org/taxsim35/)",
+    "3. Run equivalent calculations in PolicyEngine-US",
+    "4. Compare key outputs: AGI, taxable income, tax liability, credits",
+    "5. Track discrepancies and investigate systematic differences",
+    "",
+    "## References",
+    "",
+    "- [TAXSIM 35 Documentation](https://taxsim.nber.org/taxsim35/)",
+    "- [PolicyEngine-US Documentation](https://policyengine.org/us/research)",
+    "- [Cosilico US Encodings](https://github.com/CosilicoAI/cosilico-us)",
+)
 
 
 def generate_dashboard(
     comparisons: List[ComparisonResult], stats: Dict, cases: List[TaxCase]
 ) -> str:
     """Generate markdown dashboard."""
+    valid_comps = [
+        c for c in comparisons if c.taxsim is not None and c.policyengine is not None
+    ]
+
+    # Top 10 federal tax discrepancies by absolute difference
+    top_fed = heapq.nlargest(
+        10, valid_comps, key=lambda c: abs(c.policyengine.income_tax - c.taxsim.fiitax)
+    )
+    top_eitc = heapq.nlargest(
+        15,
+        (c for c in valid_comps if c.taxsim.v25_eitc > 0 or c.policyengine.eitc > 0),
+        key=lambda c: abs(c.policyengine.eitc - c.taxsim.v25_eitc),
+    )
+    top_ctc = heapq.nlargest(
+        15,
+        (
+            c
+            for c in valid_comps
+            if c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable > 0 or c.policyengine.ctc > 0
+        ),
+        key=lambda c: abs(
+            c.policyengine.ctc - (c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable)
+        ),
+    )
+
     lines = [
         "# TAXSIM Validation Dashboard",
         "",
@@ -780,195 +1146,89 @@ def generate_dashboard(
         "",
         "| Variable | N | Mean Diff | MAE | Max Abs Diff | Correlation | % Exact | % Within $10 | % Within $100 |",
         "|----------|---|-----------|-----|--------------|-------------|---------|--------------|---------------|",
-    ]
-
-    var_names = {
-        "agi": "AGI",
-        "taxable_income": "Taxable Income",
-        "federal_tax": "Federal Tax",
-        "eitc": "EITC",
-        "ctc": "CTC",
-        "fica": "FICA",
-        "amti": "AMTI",
-    }
-
-    for var, s in stats.items():
-        display_name = var_names.get(var, var)
-        lines.append(
-            f"| {display_name} | {s['n']} | ${s['mean_diff']:,.0f} | "
-            f"${s['mae']:,.0f} | ${s['max_abs_diff']:,.0f} | "
-            f"{s['correlation']:.3f} | {s['pct_exact']:.1f}% | "
-            f"{s['pct_within_10']:.1f}% | {s['pct_within_100']:.1f}% |"
-        )
-
-    lines.extend(
-        [
-            "",
-            "## Detailed Comparison",
-            "",
-            "### Sample Scenarios",
-            "",
-            "| Scenario | PE Tax | TS Tax | Diff | PE EITC | TS EITC | PE CTC | TS CTC |",
-            "|----------|--------|--------|------|---------|---------|--------|--------|",
-        ]
-    )
-
-    # Show first 30 comparisons
-    for c in comparisons[:30]:
-        if c.taxsim is None or c.policyengine is None:
-            continue
-
-        diff = c.policyengine.income_tax - c.taxsim.fiitax
-        ts_ctc = c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable
-
-        lines.append(
-            f"| {c.case.name} | ${c.policyengine.income_tax:,.0f} | "
-            f"${c.taxsim.fiitax:,.0f} | ${diff:,.0f} | "
-            f"${c.policyengine.eitc:,.0f} | ${c.taxsim.v25_eitc:,.0f} | "
-            f"${c.policyengine.ctc:,.0f} | ${ts_ctc:,.0f} |"
-        )
-
-    # Identify largest discrepancies
-    lines.extend(
-        [
-            "",
-            "### Largest Discrepancies (Federal Tax)",
-            "",
-            "| Scenario | PE Tax | TS Tax | Diff | PE AGI | TS AGI |",
-            "|----------|--------|--------|------|--------|--------|",
-        ]
-    )
-
-    # Sort by absolute difference
-    sorted_comps = sorted(
-        [c for c in comparisons if c.taxsim is not None and c.policyengine is not None],
-        key=lambda c: abs(c.policyengine.income_tax - c.taxsim.fiitax),
-        reverse=True,
-    )
-
-    for c in sorted_comps[:10]:
-        diff = c.policyengine.income_tax - c.taxsim.fiitax
-        lines.append(
-            f"| {c.case.name} | ${c.policyengine.income_tax:,.0f} | "
-            f"${c.taxsim.fiitax:,.0f} | ${diff:,.0f} | "
-            f"${c.policyengine.adjusted_gross_income:,.0f} | "
-            f"${c.taxsim.v10_agi:,.0f} |"
-        )
-
-    # EITC-specific analysis
-    lines.extend(
-        [
-            "",
-            "### EITC Discrepancies",
-            "",
-            "| Scenario | PE EITC | TS EITC | Diff | Wages | # Kids |",
-            "|----------|---------|---------|------|-------|--------|",
-        ]
-    )
-
-    eitc_cases = [
-        c
-        for c in comparisons
-        if c.taxsim is not None
-        and c.policyengine is not None
-        and (c.taxsim.v25_eitc > 0 or c.policyengine.eitc > 0)
-    ]
-    eitc_cases_sorted = sorted(
-        eitc_cases,
-        key=lambda c: abs(c.policyengine.eitc - c.taxsim.v25_eitc),
-        reverse=True,
-    )
-
-    for c in eitc_cases_sorted[:15]:
-        diff = c.policyengine.eitc - c.taxsim.v25_eitc
-        lines.append(
-            f"| {c.case.name} | ${c.policyengine.eitc:,.0f} | "
-            f"${c.taxsim.v25_eitc:,.0f} | ${diff:,.0f} | "
-            f"${c.case.pwages:,.0f} | {c.case.depx} |"
-        )
-
-    # CTC-specific analysis
-    lines.extend(
-        [
-            "",
-            "### CTC Discrepancies",
-            "",
-            "| Scenario | PE CTC | TS CTC | TS Refund | Diff | # Kids |",
-            "|----------|--------|--------|-----------|------|--------|",
-        ]
-    )
-
-    ctc_cases = [
-        c
-        for c in comparisons
-        if c.taxsim is not None
-        and c.policyengine is not None
-        and (c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable > 0 or c.policyengine.ctc > 0)
-    ]
-    ctc_cases_sorted = sorted(
-        ctc_cases,
-        key=lambda c: abs(
-            c.policyengine.ctc - (c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable)
+        *(
+            _ACCURACY_ROW.format(name=_STAT_DISPLAY_NAMES.get(var, var), **s)
+            for var, s in stats.items()
         ),
-        reverse=True,
-    )
-
-    for c in ctc_cases_sorted[:15]:
-        ts_ctc_total = c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable
-        diff = c.policyengine.ctc - ts_ctc_total
-        lines.append(
-            f"| {c.case.name} | ${c.policyengine.ctc:,.0f} | "
-            f"${c.taxsim.v22_ctc:,.0f} | ${c.taxsim.v23_ctc_refundable:,.0f} | "
-            f"${diff:,.0f} | {c.case.depx} |"
-        )
-
-    lines.extend(
-        [
-            "",
-            "## Test Scenario Categories",
-            "",
-            "1. **Single filers** - Income levels $15K to $400K",
-            "2. **Married filing jointly** - Income levels $40K to $400K",
-            "3. **Head of Household with children** - EITC eligibility scenarios",
-            "4. **MFJ with children** - CTC eligibility scenarios",
-            "5. **Self-employment income** - SE tax calculations",
-            "6. **Mixed wages + self-employment** - Combined income",
-            "7. **Investment income** - Dividends and interest",
-            "8. **Capital gains** - Long-term capital gains",
-            "9. **High income itemized** - Mortgage and property tax deductions",
-            "10. **Social Security recipients** - Benefit taxation",
-            "",
-            "## Known Differences",
-            "",
-            "### TAXSIM vs PolicyEngine",
-            "",
-            "- **Dependent handling**: TAXSIM uses `depx` count and `age1-age3` for ages; "
-            "PolicyEngine models individual dependents with specific attributes",
-            "- **Head of Household**: Filing status determination may differ",
-            "- **EITC phase-out**: Minor differences in earned income calculation",
-            "- **CTC refundability**: ACTC (refundable portion) calculation differs",
-            "- **Self-employment tax**: TAXSIM may use different SE income calculation",
-            "",
-            "## Methodology",
-            "",
-            "1. Generate standardized test cases covering key scenarios",
-            "2. Submit batch to TAXSIM 35 API (https://taxsim.nber.org/taxsim35/)",
-            "3. Run equivalent calculations in PolicyEngine-US",
-            "4. Compare key outputs: AGI, taxable income, tax liability, credits",
-            "5. Track discrepancies and investigate systematic differences",
-            "",
-            "## References",
-            "",
-            "- [TAXSIM 35 Documentation](https://taxsim.nber.org/taxsim35/)",
-            "- [PolicyEngine-US Documentation](https://policyengine.org/us/research)",
-            "- [Cosilico US Encodings](https://github.com/CosilicoAI/cosilico-us)",
-        ]
-    )
+        "",
+        "## Detailed Comparison",
+        "",
+        "### Sample Scenarios",
+        "",
+        "| Scenario | PE Tax | TS Tax | Diff | PE EITC | TS EITC | PE CTC | TS CTC |",
+        "|----------|--------|--------|------|---------|---------|--------|--------|",
+        # Show first 30 comparisons
+        *(
+            _SAMPLE_ROW.format(
+                name=c.case.name,
+                pe_tax=c.policyengine.income_tax,
+                ts_tax=c.taxsim.fiitax,
+                diff=c.policyengine.income_tax - c.taxsim.fiitax,
+                pe_eitc=c.policyengine.eitc,
+                ts_eitc=c.taxsim.v25_eitc,
+                pe_ctc=c.policyengine.ctc,
+                ts_ctc=c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable,
+            )
+            for c in comparisons[:30]
+            if c.taxsim is not None and c.policyengine is not None
+        ),
+        "",
+        "### Largest Discrepancies (Federal Tax)",
+        "",
+        "| Scenario | PE Tax | TS Tax | Diff | PE AGI | TS AGI |",
+        "|----------|--------|--------|------|--------|--------|",
+        *(
+            _FEDERAL_TAX_ROW.format(
+                name=c.case.name,
+                pe_tax=c.policyengine.income_tax,
+                ts_tax=c.taxsim.fiitax,
+                diff=c.policyengine.income_tax - c.taxsim.fiitax,
+                pe_agi=c.policyengine.adjusted_gross_income,
+                ts_agi=c.taxsim.v10_agi,
+            )
+            for c in top_fed
+        ),
+        "",
+        "### EITC Discrepancies",
+        "",
+        "| Scenario | PE EITC | TS EITC | Diff | Wages | # Kids |",
+        "|----------|---------|---------|------|-------|--------|",
+        *(
+            _EITC_ROW.format(
+                name=c.case.name,
+                pe_eitc=c.policyengine.eitc,
+                ts_eitc=c.taxsim.v25_eitc,
+                diff=c.policyengine.eitc - c.taxsim.v25_eitc,
+                wages=c.case.pwages,
+                depx=c.case.depx,
+            )
+            for c in top_eitc
+        ),
+        "",
+        "### CTC Discrepancies",
+        "",
+        "| Scenario | PE CTC | TS CTC | TS Refund | Diff | # Kids |",
+        "|----------|--------|--------|-----------|------|--------|",
+        *(
+            _CTC_ROW.format(
+                name=c.case.name,
+                pe_ctc=c.policyengine.ctc,
+                ts_ctc=c.taxsim.v22_ctc,
+                ts_refund=c.taxsim.v23_ctc_refundable,
+                diff=c.policyengine.ctc - (c.taxsim.v22_ctc + c.taxsim.v23_ctc_refundable),
+                depx=c.case.depx,
+            )
+            for c in top_ctc
+        ),
+        *_DASHBOARD_FOOTER,
+    ]
 
     return "\n".join(lines)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("TAXSIM Validation Script")
     print("=" * 50)
 
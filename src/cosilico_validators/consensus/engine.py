@@ -1,9 +1,14 @@
 """Consensus engine - aggregate results from multiple validators."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
 from cosilico_validators.validators.base import (
     BaseValidator,
     TestCase,
@@ -22,7 +27,32 @@ class ConsensusLevel(Enum):
     POTENTIAL_UPSTREAM_BUG = "potential_upstream_bug"  # DSL confident, validators disagree
 
 
-@dataclass
+# Base reward signal for each consensus level
+_LEVEL_REWARDS = MappingProxyType({
+    ConsensusLevel.FULL_AGREEMENT: 0.5,
+    ConsensusLevel.PRIMARY_CONFIRMED: 0.4,
+    ConsensusLevel.MAJORITY_AGREEMENT: 0.2,
+    ConsensusLevel.DISAGREEMENT: -0.2,
+    ConsensusLevel.POTENTIAL_UPSTREAM_BUG: 0.1,  # Slight positive - investigate
+})
+
+
+def _largest_cluster(values: np.ndarray, tolerance: float) -> np.ndarray:
+    """Mask of the largest cluster of values within tolerance of each other.
+
+    A value seeds a new cluster unless it is within tolerance of an earlier
+    seed, and joins the first seed it is near. Ties go to the earlier seed.
+    """
+    near = np.abs(values[:, None] - values[None, :]) <= tolerance
+    seeds: list[int] = []
+    for i in range(len(values)):
+        if not near[i, seeds].any():
+            seeds.append(i)
+    cluster_of = np.asarray(seeds)[near[:, seeds].argmax(axis=1)]
+    return cluster_of == np.bincount(cluster_of).argmax()
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result from multi-system validation."""
 
@@ -59,6 +89,24 @@ class ValidationResult:
         return "\n".join(lines)
 
 
+@dataclass(slots=True)
+class _ResultSummary:
+    """Validator results gathered once per validate() call.
+
+    The array fields are parallel to ``valued``: the successful results
+    that produced a value, in validator order.
+    """
+
+    names: list[str]
+    valued: list[ValidatorResult]
+    values: np.ndarray
+    is_primary: np.ndarray  # bool
+    within_tol: np.ndarray  # bool: |value - expected| <= tolerance
+    n_total: int
+    n_successful: int
+    has_primary: bool  # a PRIMARY validator succeeded
+
+
 class ConsensusEngine:
     """Engine for aggregating validation results and computing consensus."""
 
@@ -78,14 +126,11 @@ class ConsensusEngine:
         self.validators = validators
         self.tolerance = tolerance
         self.primary_weight = primary_weight
+        # (validator name, variable) -> supports_variable() answer
+        self._support_cache: dict[tuple[str, str], bool] = {}
 
         # Sort by validator type for consistent ordering
-        self.validators.sort(
-            key=lambda v: (
-                0 if v.validator_type == ValidatorType.PRIMARY else
-                1 if v.validator_type == ValidatorType.REFERENCE else 2
-            )
-        )
+        self.validators.sort(key=attrgetter("sort_order"))
 
     def validate(
         self,
@@ -105,39 +150,75 @@ class ConsensusEngine:
         Returns:
             ValidationResult with consensus and reward signal
         """
-        # Get expected value
-        expected_value = None
-        for var, value in test_case.expected.items():
-            if variable.lower() in var.lower():
-                expected_value = value
-                break
-
-        if expected_value is None:
-            expected_value = list(test_case.expected.values())[0] if test_case.expected else 0
-
         # Run all validators
         validator_results: dict[str, ValidatorResult] = {}
+        for validator in self._supporting(variable):
+            result = validator.validate(test_case, variable, year)
+            validator_results[validator.name] = result
+
+        return self._build_result(
+            test_case,
+            variable,
+            self._expected_value(test_case, variable.lower()),
+            validator_results,
+            claude_confidence,
+        )
+
+    def _supporting(self, variable: str) -> list[BaseValidator]:
+        """Validators that support ``variable``, in engine order.
+
+        supports_variable() is asked once per (validator, variable) pair.
+        """
+        supporting = []
         for validator in self.validators:
-            if validator.supports_variable(variable):
-                result = validator.validate(test_case, variable, year)
-                validator_results[validator.name] = result
+            key = (validator.name, variable)
+            supported = self._support_cache.get(key)
+            if supported is None:
+                supported = self._support_cache[key] = validator.supports_variable(variable)
+            if supported:
+                supporting.append(validator)
+        return supporting
+
+    @staticmethod
+    def _expected_value(test_case: TestCase, variable_lower: str) -> float:
+        """Pick the test case's expected value for a (lower-cased) variable.
+
+        The first expected key containing the variable name wins, falling
+        back to the first expected value.
+        """
+        for var, value in test_case.expected.items():
+            if variable_lower in var.lower():
+                return value
+
+        return next(iter(test_case.expected.values()), 0)
+
+    def _build_result(
+        self,
+        test_case: TestCase,
+        variable: str,
+        expected_value: float,
+        validator_results: dict[str, ValidatorResult],
+        claude_confidence: float | None,
+    ) -> ValidationResult:
+        """Compute consensus, reward and confidence from validator results."""
+        summary = self._summarize(validator_results, expected_value)
 
         # Compute consensus
         consensus_value, consensus_level = self._compute_consensus(
-            validator_results, expected_value, claude_confidence
+            summary, expected_value, claude_confidence
         )
 
         # Compute reward signal
-        reward_signal = self._compute_reward(
-            validator_results, expected_value, consensus_level
-        )
+        reward_signal = self._compute_reward(summary, consensus_level)
 
         # Compute confidence
-        confidence = self._compute_confidence(validator_results, consensus_value)
+        confidence = self._compute_confidence(summary, consensus_value)
 
-        # Detect potential upstream bugs
-        potential_bugs = self._detect_potential_bugs(
-            validator_results, expected_value, claude_confidence, test_case
+        # Detect potential upstream bugs (only when Claude is highly confident)
+        potential_bugs = (
+            self._detect_potential_bugs(summary, expected_value, claude_confidence, test_case)
+            if claude_confidence is not None and claude_confidence >= 0.9
+            else []
         )
 
         return ValidationResult(
@@ -152,59 +233,69 @@ class ConsensusEngine:
             potential_bugs=potential_bugs,
         )
 
+    def _summarize(
+        self, results: dict[str, ValidatorResult], expected: float
+    ) -> _ResultSummary:
+        """Collect validator values and flags in a single pass over results."""
+        names: list[str] = []
+        valued: list[ValidatorResult] = []
+        n_successful = 0
+        has_primary = False
+        for name, result in results.items():
+            if not result.success:
+                continue
+            n_successful += 1
+            has_primary = has_primary or result.validator_type == ValidatorType.PRIMARY
+            if result.calculated_value is not None:
+                names.append(name)
+                valued.append(result)
+
+        values = np.fromiter((r.calculated_value for r in valued), dtype=np.float64, count=len(valued))
+        is_primary = np.fromiter(
+            (r.validator_type == ValidatorType.PRIMARY for r in valued), dtype=bool, count=len(valued)
+        )
+        return _ResultSummary(
+            names=names,
+            valued=valued,
+            values=values,
+            is_primary=is_primary,
+            within_tol=np.abs(values - expected) <= self.tolerance,
+            n_total=len(results),
+            n_successful=n_successful,
+            has_primary=has_primary,
+        )
+
     def _compute_consensus(
         self,
-        results: dict[str, ValidatorResult],
+        summary: _ResultSummary,
         expected: float,
         claude_confidence: float | None,
     ) -> tuple[float | None, ConsensusLevel]:
         """Compute consensus value and level from validator results."""
-        # Get successful results with values
-        values: list[tuple[str, float, ValidatorType]] = []
-        for name, result in results.items():
-            if result.success and result.calculated_value is not None:
-                values.append((name, result.calculated_value, result.validator_type))
-
-        if not values:
+        values = summary.values
+        n = len(values)
+        if not n:
             return None, ConsensusLevel.DISAGREEMENT
 
         # Check for full agreement (within tolerance)
-        all_values = [v[1] for v in values]
-        mean_value = sum(all_values) / len(all_values)
-
-        all_agree = all(abs(v - mean_value) <= self.tolerance for v in all_values)
-        if all_agree:
+        mean_value = float(values.mean())
+        if np.all(np.abs(values - mean_value) <= self.tolerance):
             return mean_value, ConsensusLevel.FULL_AGREEMENT
 
         # Check if primary validator agrees with expected
-        primary_results = [(n, v, t) for n, v, t in values if t == ValidatorType.PRIMARY]
-        if primary_results:
-            primary_value = primary_results[0][1]
-            if abs(primary_value - expected) <= self.tolerance:
+        if summary.is_primary.any():
+            primary_idx = int(summary.is_primary.argmax())
+            if summary.within_tol[primary_idx]:
+                primary_value = summary.valued[primary_idx].calculated_value
                 # Check if majority also agrees with primary
-                agreeing = sum(
-                    1 for _, v, _ in values if abs(v - primary_value) <= self.tolerance
-                )
-                if agreeing > len(values) / 2:
+                agreeing = np.count_nonzero(np.abs(values - primary_value) <= self.tolerance)
+                if agreeing > n / 2:
                     return primary_value, ConsensusLevel.PRIMARY_CONFIRMED
 
         # Check for majority agreement
-        # Group values by similarity
-        clusters: list[list[float]] = []
-        for _, v, _ in values:
-            added = False
-            for cluster in clusters:
-                if abs(v - cluster[0]) <= self.tolerance:
-                    cluster.append(v)
-                    added = True
-                    break
-            if not added:
-                clusters.append([v])
-
-        # Find largest cluster
-        largest_cluster = max(clusters, key=len)
-        if len(largest_cluster) > len(values) / 2:
-            cluster_mean = sum(largest_cluster) / len(largest_cluster)
+        in_cluster = _largest_cluster(values, self.tolerance)
+        if np.count_nonzero(in_cluster) > n / 2:
+            cluster_mean = float(values[in_cluster].mean())
             return cluster_mean, ConsensusLevel.MAJORITY_AGREEMENT
 
         # Check for potential upstream bug
@@ -217,8 +308,7 @@ class ConsensusEngine:
 
     def _compute_reward(
         self,
-        results: dict[str, ValidatorResult],
-        expected: float,
+        summary: _ResultSummary,
         consensus_level: ConsensusLevel,
     ) -> float:
         """Compute reward signal (-1.0 to 1.0) for training.
@@ -228,44 +318,30 @@ class ConsensusEngine:
         - Primary validators confirm
         - High consensus level
         """
-        if not results:
+        if not summary.n_total:
             return 0.0
 
         # Base reward from consensus level
-        level_rewards = {
-            ConsensusLevel.FULL_AGREEMENT: 0.5,
-            ConsensusLevel.PRIMARY_CONFIRMED: 0.4,
-            ConsensusLevel.MAJORITY_AGREEMENT: 0.2,
-            ConsensusLevel.DISAGREEMENT: -0.2,
-            ConsensusLevel.POTENTIAL_UPSTREAM_BUG: 0.1,  # Slight positive - investigate
-        }
-        reward = level_rewards.get(consensus_level, 0.0)
-
-        # Add reward for matching expected value
-        matches = 0
-        total_weight = 0
-        for _name, result in results.items():
-            if result.success and result.calculated_value is not None:
-                weight = self.primary_weight if result.validator_type == ValidatorType.PRIMARY else 1.0
-                total_weight += weight
-                if abs(result.calculated_value - expected) <= self.tolerance:
-                    matches += weight
+        reward = _LEVEL_REWARDS.get(consensus_level, 0.0)
 
+        # Add reward for matching expected value (primary validators weighted up)
+        weights = np.where(summary.is_primary, self.primary_weight, 1.0)
+        total_weight = weights.sum()
         if total_weight > 0:
-            match_ratio = matches / total_weight
+            match_ratio = weights[summary.within_tol].sum() / total_weight
             reward += match_ratio * 0.5  # Up to +0.5 for all matches
 
-        return max(-1.0, min(1.0, reward))
+        return max(-1.0, min(1.0, float(reward)))
 
     def _compute_confidence(
-        self, results: dict[str, ValidatorResult], consensus_value: float | None
+        self, summary: _ResultSummary, consensus_value: float | None
     ) -> float:
         """Compute confidence in the validation result (0.0 to 1.0)."""
         if consensus_value is None:
             return 0.0
 
-        successful = [r for r in results.values() if r.success]
-        if not successful:
+        n_successful = summary.n_successful
+        if not n_successful:
             return 0.0
 
         # Confidence based on:
@@ -273,67 +349,53 @@ class ConsensusEngine:
         # 2. Agreement with consensus value
         # 3. Presence of primary validator
 
-        n_successful = len(successful)
-        n_total = len(results)
-
         # Base confidence from success rate
-        success_rate = n_successful / n_total if n_total > 0 else 0
+        success_rate = n_successful / summary.n_total
 
         # Agreement with consensus
-        agreeing = sum(
-            1 for r in successful
-            if r.calculated_value is not None
-            and abs(r.calculated_value - consensus_value) <= self.tolerance
-        )
-        agreement_rate = agreeing / n_successful if n_successful > 0 else 0
+        agreeing = int(np.count_nonzero(np.abs(summary.values - consensus_value) <= self.tolerance))
+        agreement_rate = agreeing / n_successful
 
         # Bonus for primary validator
-        has_primary = any(
-            r.validator_type == ValidatorType.PRIMARY and r.success
-            for r in results.values()
-        )
-        primary_bonus = 0.1 if has_primary else 0
+        primary_bonus = 0.1 if summary.has_primary else 0
 
         confidence = (success_rate * 0.3 + agreement_rate * 0.6 + primary_bonus)
         return min(1.0, confidence)
 
     def _detect_potential_bugs(
         self,
-        results: dict[str, ValidatorResult],
+        summary: _ResultSummary,
         expected: float,
         claude_confidence: float | None,
         test_case: TestCase,
     ) -> list[dict[str, Any]]:
         """Detect potential bugs in upstream systems.
 
-        Returns list of potential bugs when:
-        - Claude is highly confident
+        Called only when Claude is highly confident. Returns list of
+        potential bugs when:
         - Expected value differs from validator result
         - Citation is clear
         """
-        potential_bugs = []
-
-        if not claude_confidence or claude_confidence < 0.9:
-            return potential_bugs
+        citation = test_case.citation
+        case_name = test_case.name
+        inputs = test_case.inputs
 
-        for name, result in results.items():
-            if not result.success or result.calculated_value is None:
-                continue
-
-            diff = abs(result.calculated_value - expected)
-            if diff > self.tolerance:
-                # Potential bug in this validator
-                potential_bugs.append({
-                    "validator": name,
-                    "validator_type": result.validator_type.value,
-                    "expected": expected,
-                    "actual": result.calculated_value,
-                    "difference": diff,
-                    "citation": test_case.citation,
-                    "test_case": test_case.name,
-                    "inputs": test_case.inputs,
-                    "claude_confidence": claude_confidence,
-                })
+        potential_bugs = []
+        for i in np.flatnonzero(~summary.within_tol):
+            # Potential bug in this validator
+            result = summary.valued[i]
+            actual = result.calculated_value
+            potential_bugs.append({
+                "validator": summary.names[i],
+                "validator_type": result.validator_type.value,
+                "expected": expected,
+                "actual": actual,
+                "difference": abs(actual - expected),
+                "citation": citation,
+                "test_case": case_name,
+                "inputs": inputs,
+                "claude_confidence": claude_confidence,
+            })
 
         return potential_bugs
 
@@ -342,6 +404,41 @@ class ConsensusEngine:
         test_cases: list[TestCase],
         variable: str,
         year: int = 2024,
+        max_workers: int | None = None,
     ) -> list[ValidationResult]:
-        """Validate multiple test cases."""
-        return [self.validate(tc, variable, year) for tc in test_cases]
+        """Validate multiple test cases.
+
+        Each validator receives all test cases at once through its
+        batch_validate hook (so e.g. TAXSIM sends one request for the whole
+        batch), and the validators run concurrently in a thread pool.
+
+        Args:
+            test_cases: Test cases with inputs and expected outputs
+            variable: Variable to validate
+            year: Tax year
+            max_workers: Thread pool size (default: one per validator)
+        """
+        validators = self._supporting(variable)
+        if not test_cases:
+            return []
+
+        per_validator: list[list[ValidatorResult]] = []
+        if validators:
+            with ThreadPoolExecutor(max_workers=max_workers or len(validators)) as executor:
+                per_validator = list(
+                    executor.map(
+                        lambda v: v.batch_validate(test_cases, variable, year), validators
+                    )
+                )
+
+        variable_lower = variable.lower()
+        return [
+            self._build_result(
+                tc,
+                variable,
+                self._expected_value(tc, variable_lower),
+                {v.name: results[i] for v, results in zip(validators, per_validator)},
+                None,
+            )
+            for i, tc in enumerate(test_cases)
+        ]
@@ -34,21 +34,30 @@ Usage:
 ################################################################################
 """
 
+import functools
 import json
-import subprocess
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 import click
 import numpy as np
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
 from cosilico_validators.comparison.aligned import (
     load_common_dataset,
     compare_variable,
     ComparisonResult,
 )
+from cosilico_validators.harness.checkpoint import get_git_commit
 
 
 # Variables to validate - keys are PolicyEngine variable names
@@ -70,22 +79,30 @@ VARIABLES = {
 }
 
 
-def get_git_commit() -> str:
-    """Get current git commit hash."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent,
-        )
-        return result.stdout.strip() or "unknown"
-    except Exception:
-        return "unknown"
+# Validators not yet wired into the export (constant across runs; copied into
+# each export so callers can edit their result freely)
+_UNAVAILABLE_VALIDATORS = (
+    {
+        "name": "TAXSIM",
+        "available": False,
+        "version": "35",
+        "householdsCovered": 0,
+    },
+    {
+        "name": "Tax-Calculator",
+        "available": False,
+        "version": "latest",
+        "householdsCovered": 0,
+    },
+)
 
 
+@functools.lru_cache(maxsize=1)
 def load_cosilico_engine():
-    """Load the Cosilico engine from cosilico-engine repo."""
+    """Load the Cosilico engine from cosilico-engine repo.
+
+    Cached so the repo is only put on ``sys.path`` once per process.
+    """
     engine_path = Path.home() / "CosilicoAI" / "cosilico-engine" / "src"
     if engine_path.exists():
         sys.path.insert(0, str(engine_path))
@@ -194,9 +211,13 @@ STD_DEDUCTION_PARAMS_2024 = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def load_rac_file(section: str) -> Optional[str]:
     """Load .rac file for a given section from cosilico-us.
 
+    Cached per section (several variables share one section); call
+    ``load_rac_file.cache_clear()`` to pick up edits.
+
     Args:
         section: USC section like "26/32" or "26/63"
 
@@ -220,6 +241,9 @@ def load_rac_file(section: str) -> Optional[str]:
 
 def result_to_section(result: ComparisonResult, n_households: int, meta: dict, implemented: bool) -> dict:
     """Convert ComparisonResult to ValidationSection format."""
+    n_records = result.n_records
+    match_rate = result.match_rate
+    matches = int(match_rate * n_records)
     return {
         "section": meta["section"],
         "title": meta["title"],
@@ -228,16 +252,16 @@ def result_to_section(result: ComparisonResult, n_households: int, meta: dict, i
         "households": n_households,
         "testCases": [],
         "summary": {
-            "total": result.n_records,
-            "matches": int(result.match_rate * result.n_records),
-            "matchRate": result.match_rate,
+            "total": n_records,
+            "matches": matches,
+            "matchRate": match_rate,
             "meanAbsoluteError": result.mean_absolute_error,
         },
         "validatorBreakdown": {
             "policyengine": {
-                "matches": int(result.match_rate * result.n_records),
-                "total": result.n_records,
-                "rate": result.match_rate,
+                "matches": matches,
+                "total": n_records,
+                "rate": match_rate,
             }
         },
         "notes": (
@@ -248,7 +272,42 @@ def result_to_section(result: ComparisonResult, n_households: int, meta: dict, i
     }
 
 
-def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
+def write_ndjson(dashboard_data: dict, output_path: Path) -> None:
+    """Write dashboard data as JSON Lines, one record per line.
+
+    Emits a ``header`` record (run metadata), one ``section`` record per
+    variable, then ``coverage``, ``overall`` and ``validators`` records, so
+    consumers (e.g. ``pandas.read_json(lines=True)``) can process sections
+    without parsing the whole document.
+    """
+    header = {
+        key: value
+        for key, value in dashboard_data.items()
+        if key not in ("sections", "coverage", "overall", "validators")
+    }
+    records = [
+        {"type": "header", **header},
+        *({"type": "section", **section} for section in dashboard_data["sections"]),
+        {"type": "coverage", **dashboard_data["coverage"]},
+        {"type": "overall", **dashboard_data["overall"]},
+        {"type": "validators", "validators": dashboard_data["validators"]},
+    ]
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        for record in records:
+            if HAS_ORJSON:
+                f.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                f.write(json.dumps(record, separators=(",", ":")).encode())
+            f.write(b"\n")
+
+
+def run_export(
+    year: int = 2024,
+    output_path: Optional[Path] = None,
+    ndjson: bool = False,
+    pretty: bool = True,
+    debug: bool = False,
+) -> dict:
     """Run validation and export to dashboard format.
 
     This function:
@@ -256,14 +315,37 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
     2. For each variable, loads the .rac file and executes it
     3. Compares against PolicyEngine outputs
     4. Returns dashboard-formatted results
+
+    If ``ndjson`` is set, ``output_path`` is written as JSON Lines (see
+    ``write_ndjson``) instead of a single JSON document. ``pretty=False``
+    writes the document without indentation (roughly half the bytes).
+    ``debug`` prints full tracebacks when an engine integration fails.
     """
     from policyengine_us import Microsimulation
 
+    # One PE microsimulation serves both the common dataset and the
+    # comparison targets, so PE's own variable cache is shared too
+    sim = Microsimulation()
+
+    # PE arrays by variable, shared with load_common_dataset so variables it
+    # already fetched (AGI, taxable income, ...) aren't fetched again
+    pe_cache: dict[str, np.ndarray] = {}
+
+    def pe_calc(variable: str) -> np.ndarray:
+        """PE values for ``variable``, calculated at most once per export."""
+        if variable not in pe_cache:
+            pe_cache[variable] = np.array(sim.calculate(variable, year))
+        return pe_cache[variable]
+
     # Load common dataset
     print("Loading common dataset from PolicyEngine...")
-    dataset = load_common_dataset(year)
+    dataset = load_common_dataset(year, sim=sim, calculated=pe_cache)
     print(f"  {dataset.n_records:,} tax units loaded")
 
+    # Engine inputs shared by several variables, derived once per export
+    filing_status = np.where(dataset.is_joint, 'JOINT', 'SINGLE')
+    ctc_children = dataset.ctc_child_count.astype(int)
+
     # Load Cosilico engine
     print("Loading Cosilico engine...")
     try:
@@ -278,9 +360,8 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
         engine_available = False
         dep_resolver = None
 
-    # Get PE microsimulation
+    # Get PE calculations
     print("Loading PolicyEngine calculations...")
-    sim = Microsimulation()
 
     # Run comparisons for all variables
     results = []
@@ -289,7 +370,7 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
 
         try:
             # Get PolicyEngine values
-            pe_values = np.array(sim.calculate(var_name, year))
+            pe_values = pe_calc(var_name)
 
             # Try to load and execute .rac file
             rac_code = load_rac_file(meta["section"])
@@ -310,7 +391,7 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
                             'num_qualifying_children': np.clip(dataset.eitc_child_count, 0, 3).astype(int),
                             'earned_income': dataset.earned_income,
                             'adjusted_gross_income': dataset.adjusted_gross_income,
-                            'filing_status': np.where(dataset.is_joint, 'JOINT', 'SINGLE'),
+                            'filing_status': filing_status,
                         }
 
                         # Execute through engine
@@ -341,7 +422,7 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
                             'net_investment_income': dataset.investment_income,
                             'adjusted_gross_income': dataset.adjusted_gross_income,
                             'foreign_earned_income_exclusion': np.zeros(dataset.n_records),
-                            'filing_status': np.where(dataset.is_joint, 'JOINT', 'SINGLE'),
+                            'filing_status': filing_status,
                         }
 
                         # Execute through engine using standalone version (no imports)
@@ -417,17 +498,17 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
             elif var_name == "ctc" and engine_available and dep_resolver:
                 try:
                     # Get tax liability from PE for tax limit calculation
-                    pe_tax_before_credits = np.array(sim.calculate("income_tax_before_credits", year))
+                    pe_tax_before_credits = pe_calc("income_tax_before_credits")
                     # Get EITC from PE for ACTC SS tax formula (3+ children)
-                    pe_eitc = np.array(sim.calculate("eitc", year))
+                    pe_eitc = pe_calc("eitc")
                     # Get SS taxes from PE for ACTC formula (use TaxUnit-level variable)
-                    pe_ss_taxes = np.array(sim.calculate("pr_refundable_ctc_social_security_tax", year))
+                    pe_ss_taxes = pe_calc("pr_refundable_ctc_social_security_tax")
 
                     # Build inputs - these break circular dependencies (like OpenFisca)
                     inputs = {
-                        'num_ctc_qualifying_children': dataset.ctc_child_count.astype(int),
+                        'num_ctc_qualifying_children': ctc_children,
                         'adjusted_gross_income': dataset.adjusted_gross_income,
-                        'filing_status': np.where(dataset.is_joint, 'JOINT', 'SINGLE'),
+                        'filing_status': filing_status,
                         'earned_income': dataset.earned_income,
                         'tax_liability_limit': pe_tax_before_credits,
                         'social_security_taxes': pe_ss_taxes,
@@ -448,8 +529,9 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
                     implemented = True
                 except Exception as e:
                     print(f"    CTC engine failed: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    if debug:
+                        import traceback
+                        traceback.print_exc()
                     implemented = False
 
             # Non-refundable CTC engine integration - 26 USC Section 24(a)
@@ -457,13 +539,13 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
             elif var_name == "non_refundable_ctc" and engine_available and dep_resolver:
                 try:
                     # Get tax liability from PE for tax limit calculation
-                    pe_tax_before_credits = np.array(sim.calculate("income_tax_before_credits", year))
+                    pe_tax_before_credits = pe_calc("income_tax_before_credits")
 
                     # Build inputs from dataset (break circular deps)
                     inputs = {
-                        'num_ctc_qualifying_children': dataset.ctc_child_count.astype(int),
+                        'num_ctc_qualifying_children': ctc_children,
                         'adjusted_gross_income': dataset.adjusted_gross_income,
-                        'filing_status': np.where(dataset.is_joint, 'JOINT', 'SINGLE'),
+                        'filing_status': filing_status,
                         'tax_liability_limit': pe_tax_before_credits,
                     }
 
@@ -488,18 +570,18 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
             elif var_name == "refundable_ctc" and engine_available and dep_resolver:
                 try:
                     # Get EITC from PE for ACTC SS tax formula (3+ children)
-                    pe_eitc = np.array(sim.calculate("eitc", year))
+                    pe_eitc = pe_calc("eitc")
                     # Get SS taxes from PE for ACTC formula
                     # Use TaxUnit-level variable for refundable CTC calculation
-                    pe_ss_taxes = np.array(sim.calculate("pr_refundable_ctc_social_security_tax", year))
+                    pe_ss_taxes = pe_calc("pr_refundable_ctc_social_security_tax")
                     # Get tax liability from PE for ctc_before_limit calculation
-                    pe_tax_before_credits = np.array(sim.calculate("income_tax_before_credits", year))
+                    pe_tax_before_credits = pe_calc("income_tax_before_credits")
 
                     # Build inputs - lazy resolution handles child_tax_credit_before_limit automatically
                     inputs = {
-                        'num_ctc_qualifying_children': dataset.ctc_child_count.astype(int),
+                        'num_ctc_qualifying_children': ctc_children,
                         'adjusted_gross_income': dataset.adjusted_gross_income,
-                        'filing_status': np.where(dataset.is_joint, 'JOINT', 'SINGLE'),
+                        'filing_status': filing_status,
                         'earned_income': dataset.earned_income,
                         'tax_liability_limit': pe_tax_before_credits,
                         'social_security_taxes': pe_ss_taxes,
@@ -545,7 +627,7 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
                             # Earned income for limitation - lesser of spouse earnings for married (26 USC 21(d))
                             'earned_income': dataset.earned_income,
                             # Filing status for earned income limit calculation
-                            'filing_status': np.where(dataset.is_joint, 'JOINT', 'SINGLE'),
+                            'filing_status': filing_status,
                         }
 
                         # Execute through engine using standalone formula
@@ -574,7 +656,7 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
                         # Build inputs for standalone formula
                         inputs = {
                             # Filing status - use raw values, enums handle JOINT etc
-                            'filing_status': np.where(dataset.is_joint, 'JOINT', 'SINGLE'),
+                            'filing_status': filing_status,
                             # Max age in tax unit for 63(f)(1) aged deduction
                             'max_age': np.maximum(dataset.head_age, dataset.spouse_age),
                             # Any blind in tax unit for 63(f)(2) blind deduction
@@ -608,7 +690,8 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
                 _cos_values = cos_values
                 cos_func = lambda ds, v=_cos_values: v
 
-            result = compare_variable(dataset, cos_func, pe_values, var_name)
+            # Only summary metrics are exported; don't hold per-record arrays
+            result = compare_variable(dataset, cos_func, pe_values, var_name, retain_values=False)
             results.append((result, meta, implemented))
 
             status = "✓ ENGINE" if implemented else "○ (not in engine yet)"
@@ -618,24 +701,35 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
             print(f"  ✗ Error: {e}")
             continue
 
-    # Build ValidationResults structure
-    sections = [result_to_section(r, dataset.n_records, meta, impl) for r, meta, impl in results]
-
-    # Separate implemented vs stub for overall calculation
-    implemented_results = [r for r, m, impl in results if impl]
-    if implemented_results:
-        overall_match_rate = np.mean([r.match_rate for r in implemented_results])
-        overall_mae = np.mean([r.mean_absolute_error for r in implemented_results])
-    else:
-        overall_match_rate = 0.0
-        overall_mae = 0.0
-
-    n_implemented = sum(1 for _, _, impl in results if impl)
+    # All PE values we need are in `results` now; release the simulation
+    # before building and serializing the payload
+    sim = None
+    pe_cache.clear()
+
+    # Build ValidationResults structure and overall totals in one pass.
+    # Overall match rate and MAE only count implemented (non-stub) variables.
+    sections = []
+    n_implemented = 0
+    total_tests = 0
+    total_matches = 0
+    match_rate_sum = 0.0
+    mae_sum = 0.0
+    for r, meta, impl in results:
+        sections.append(result_to_section(r, dataset.n_records, meta, impl))
+        total_tests += r.n_records
+        if impl:
+            n_implemented += 1
+            total_matches += int(r.match_rate * r.n_records)
+            match_rate_sum += r.match_rate
+            mae_sum += r.mean_absolute_error
+
+    overall_match_rate = match_rate_sum / n_implemented if n_implemented else 0.0
+    overall_mae = mae_sum / n_implemented if n_implemented else 0.0
     n_total = len(results)
 
     dashboard_data = {
         "isSampleData": False,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "commit": get_git_commit(),
         "dataSource": f"PolicyEngine Enhanced CPS {year}",
         "householdsTotal": dataset.n_records,
@@ -647,8 +741,8 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
         },
         "overall": {
             "totalHouseholds": dataset.n_records,
-            "totalTests": sum(r.n_records for r, _, _ in results),
-            "totalMatches": sum(int(r.match_rate * r.n_records) for r, _, impl in results if impl),
+            "totalTests": total_tests,
+            "totalMatches": total_matches,
             "matchRate": overall_match_rate,
             "meanAbsoluteError": overall_mae,
         },
@@ -659,26 +753,30 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
                 "version": "latest",
                 "householdsCovered": dataset.n_records,
             },
-            {
-                "name": "TAXSIM",
-                "available": False,
-                "version": "35",
-                "householdsCovered": 0,
-            },
-            {
-                "name": "Tax-Calculator",
-                "available": False,
-                "version": "latest",
-                "householdsCovered": 0,
-            },
+            *(dict(v) for v in _UNAVAILABLE_VALIDATORS),
         ],
     }
 
     # Write to file if path provided
     if output_path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(dashboard_data, f, indent=2)
+        if not output_path.parent.is_dir():
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        if ndjson:
+            write_ndjson(dashboard_data, output_path)
+        elif HAS_ORJSON:
+            # C serializer; handles NumPy scalars natively
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            output_path.write_bytes(orjson.dumps(dashboard_data, option=option))
+        else:
+            # json.dump streams encoder chunks straight to the file; a large
+            # buffer batches its many small writes into few syscalls
+            with open(output_path, "w", buffering=1 << 20) as f:
+                if pretty:
+                    json.dump(dashboard_data, f, indent=2)
+                else:
+                    json.dump(dashboard_data, f, separators=(",", ":"))
         print(f"\nWritten to {output_path}")
 
     return dashboard_data
@@ -687,10 +785,13 @@ def run_export(year: int = 2024, output_path: Optional[Path] = None) -> dict:
 @click.command()
 @click.option("--year", "-y", default=2024, help="Tax year")
 @click.option("--output", "-o", type=click.Path(), help="Output JSON file")
-def main(year: int, output: Optional[str]):
+@click.option("--ndjson", is_flag=True, help="Write JSON Lines (one record per line)")
+@click.option("--compact", is_flag=True, help="Write JSON without indentation")
+@click.option("--debug", is_flag=True, help="Print tracebacks for engine failures")
+def main(year: int, output: Optional[str], ndjson: bool, compact: bool, debug: bool):
     """Export validation results to dashboard format."""
     output_path = Path(output) if output else None
-    data = run_export(year, output_path)
+    data = run_export(year, output_path, ndjson=ndjson, pretty=not compact, debug=debug)
 
     print("\n=== Summary ===")
     print(f"Coverage: {data['coverage']['implemented']}/{data['coverage']['total']} variables via engine")
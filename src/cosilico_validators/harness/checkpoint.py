@@ -1,5 +1,6 @@
 """Checkpoint system for saving and loading validation baselines."""
 
+import functools
 import json
 import subprocess
 from datetime import datetime
@@ -9,14 +10,64 @@ from typing import Optional
 from . import Checkpoint, Delta, HarnessResult
 
 
+def _read_git_head(start: Path) -> Optional[str]:
+    """Resolve HEAD to a short hash by reading ``.git`` directly.
+
+    Returns None when the layout isn't a plain repository (worktrees,
+    submodules, missing refs) so the caller can fall back to git itself.
+    """
+    for directory in (start, *start.parents):
+        git_dir = directory / ".git"
+        if git_dir.exists():
+            break
+    else:
+        return None
+    if not git_dir.is_dir():
+        return None
+
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        return head[:7] or None  # Detached HEAD
+
+    ref = head[len("ref: "):]
+    ref_path = git_dir / ref
+    if ref_path.is_file():
+        return ref_path.read_text().strip()[:7] or None
+
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref:
+                return sha[:7]
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def get_git_commit() -> str:
-    """Get current git commit hash."""
+    """Get current git commit hash.
+
+    Reads ``.git/HEAD`` directly and only spawns ``git rev-parse`` when
+    that fails. Cached for the life of the process; call
+    ``get_git_commit.cache_clear()`` to pick up a new HEAD.
+    """
+    here = Path(__file__).parent
+    try:
+        commit = _read_git_head(here)
+        if commit:
+            return commit
+    except OSError:
+        pass
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--short", "HEAD"],
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            cwd=Path(__file__).parent,
+            cwd=here,
+            timeout=2,
         )
         return result.stdout.strip() or "unknown"
     except Exception:
@@ -1,10 +1,20 @@
-"""Tax/benefit system validators."""
+"""Tax/benefit system validators.
+
+Validator implementations are imported on first attribute access (PEP 562),
+so their heavy dependencies (pandas, PolicyEngine, ...) load only when used.
+"""
+
+import importlib
 
 from cosilico_validators.validators.base import BaseValidator
-from cosilico_validators.validators.policyengine import PolicyEngineValidator
-from cosilico_validators.validators.taxcalc import TaxCalculatorValidator
-from cosilico_validators.validators.taxsim import TaxsimValidator
-from cosilico_validators.validators.yale import YaleTaxValidator
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "PolicyEngineValidator": ".policyengine",
+    "TaxCalculatorValidator": ".taxcalc",
+    "TaxsimValidator": ".taxsim",
+    "YaleTaxValidator": ".yale",
+}
 
 __all__ = [
     "BaseValidator",
@@ -13,3 +23,15 @@ __all__ = [
     "TaxsimValidator",
     "YaleTaxValidator",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY})
@@ -14,6 +14,14 @@ class ValidatorType(Enum):
     SUPPLEMENTARY = "supplementary"  # PSL, Atlanta Fed PRD - additional signal
 
 
+# Rank of each validator type when ordering validators (most authoritative first)
+_SORT_ORDER = {
+    ValidatorType.PRIMARY: 0,
+    ValidatorType.REFERENCE: 1,
+    ValidatorType.SUPPLEMENTARY: 2,
+}
+
+
 @dataclass
 class TestCase:
     """A single test case for validation."""
@@ -47,6 +55,11 @@ class BaseValidator(ABC):
     validator_type: ValidatorType
     supported_variables: set[str]
 
+    @property
+    def sort_order(self) -> int:
+        """Rank by authority: PRIMARY, then REFERENCE, then SUPPLEMENTARY."""
+        return _SORT_ORDER[self.validator_type]
+
     @abstractmethod
     def validate(
         self, test_case: TestCase, variable: str, year: int = 2024
@@ -131,8 +131,7 @@ class PolicyEngineValidator(BaseValidator):
                 "families",
                 "marital_units",
             ]:
-                entity_name = list(situation[entity].keys())[0]
-                situation[entity][entity_name]["members"].append("spouse")
+                next(iter(situation[entity].values()))["members"].append("spouse")
 
     def _add_children(self, situation: dict, count: int, year_str: str) -> None:
         """Add qualifying children to the household."""
@@ -143,8 +142,7 @@ class PolicyEngineValidator(BaseValidator):
                 "is_tax_unit_dependent": {year_str: True},
             }
             for entity in ["tax_units", "spm_units", "households", "families"]:
-                entity_name = list(situation[entity].keys())[0]
-                situation[entity][entity_name]["members"].append(child_id)
+                next(iter(situation[entity].values()))["members"].append(child_id)
 
     def _set_state(self, situation: dict, state: str, year_str: str) -> None:
         """Set the household state."""
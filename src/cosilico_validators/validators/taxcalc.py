@@ -7,9 +7,7 @@ See: https://github.com/PSLmodels/Tax-Calculator
 Docs: https://taxcalc.pslmodels.org/
 """
 
-from typing import Any
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any
 
 from cosilico_validators.validators.base import (
     BaseValidator,
@@ -18,6 +16,9 @@ from cosilico_validators.validators.base import (
     ValidatorType,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Variable mapping from common names to Tax-Calculator variable names
 # Output variables: https://taxcalc.pslmodels.org/guide/output_vars.html
 VARIABLE_MAPPING = {
@@ -109,7 +110,7 @@ class TaxCalculatorValidator(BaseValidator):
 
     def _build_input_dataframe(
         self, test_case: TestCase, year: int
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """Convert test case inputs to Tax-Calculator input DataFrame.
 
         Tax-Calculator requires specific variable names. We create a
@@ -262,6 +263,8 @@ class TaxCalculatorValidator(BaseValidator):
         if tc_inputs["MARS"] == 2 and tc_inputs["age_spouse"] == 0:
             tc_inputs["age_spouse"] = tc_inputs["age_head"]
 
+        import pandas as pd
+
         return pd.DataFrame([tc_inputs])
 
     def validate(
@@ -267,21 +267,14 @@ class TaxsimValidator(BaseValidator):
 
         return taxsim_input
 
-    def _create_input_csv(self, taxsim_input: dict) -> str:
-        """Create TAXSIM input CSV file."""
-        temp_file = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
+    def _create_local_csv(self, taxsim_inputs: list[dict]) -> str:
+        """Create TAXSIM input CSV text for the local executable."""
+        lines = [",".join(TAXSIM_COLUMNS)]
+        lines.extend(
+            ",".join([str(ti.get(col, 0)) for col in TAXSIM_COLUMNS])
+            for ti in taxsim_inputs
         )
-
-        # Write header
-        temp_file.write(",".join(TAXSIM_COLUMNS) + "\n")
-
-        # Write data row
-        row = [str(taxsim_input.get(col, 0)) for col in TAXSIM_COLUMNS]
-        temp_file.write(",".join(row) + "\n")
-
-        temp_file.close()
-        return temp_file.name
+        return "\n".join(lines) + "\n"
 
     def _create_csv_string(self, taxsim_input: dict) -> str:
         """Create TAXSIM input as a CSV string (for web API)."""
@@ -358,54 +351,43 @@ class TaxsimValidator(BaseValidator):
 
         raise RuntimeError("TAXSIM API failed after all retries")
 
-    def _execute_local(self, input_file: str) -> str:
-        """Execute TAXSIM locally and return output."""
+    def _execute_local(self, csv_data: str) -> str:
+        """Execute TAXSIM locally and return output.
+
+        The input CSV is streamed to the executable's stdin and its output
+        read from stdout, with no temp files or shell pipeline.
+        """
         if self.taxsim_path is None:
             raise RuntimeError("Local mode requires TAXSIM executable path")
 
+        system = platform.system().lower()
+
         # Make executable on Unix
-        if platform.system().lower() != "windows":
+        if system != "windows":
             os.chmod(self.taxsim_path, 0o755)
 
-        # Create output file
-        output_fd, output_file = tempfile.mkstemp(suffix=".csv")
-        os.close(output_fd)
-
-        try:
-            system = platform.system().lower()
-
-            if system != "windows":
-                cmd = f'cat "{input_file}" | "{self.taxsim_path}" > "{output_file}"'
-            else:
-                cmd = f'type "{input_file}" | "{self.taxsim_path}" > "{output_file}"'
-
-            # Set up environment
-            env = os.environ.copy()
-            if system == "darwin":
-                homebrew_paths = ["/opt/homebrew/bin", "/usr/local/bin"]
-                current_path = env.get("PATH", "")
-                for hb_path in reversed(homebrew_paths):
-                    if hb_path not in current_path:
-                        current_path = f"{hb_path}:{current_path}"
-                env["PATH"] = current_path
-
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                env=env,
-            )
-
-            if result.returncode != 0:
-                raise RuntimeError(f"TAXSIM failed: {result.stderr}")
+        # Set up environment
+        env = os.environ.copy()
+        if system == "darwin":
+            homebrew_paths = ["/opt/homebrew/bin", "/usr/local/bin"]
+            current_path = env.get("PATH", "")
+            for hb_path in reversed(homebrew_paths):
+                if hb_path not in current_path:
+                    current_path = f"{hb_path}:{current_path}"
+            env["PATH"] = current_path
+
+        result = subprocess.run(
+            [str(self.taxsim_path)],
+            input=csv_data,
+            capture_output=True,
+            text=True,
+            env=env,
+        )
 
-            with open(output_file, "r") as f:
-                return f.read()
+        if result.returncode != 0:
+            raise RuntimeError(f"TAXSIM failed: {result.stderr}")
 
-        finally:
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+        return result.stdout
 
     def _parse_output(self, output: str, variable: str) -> float | None:
         """Parse TAXSIM output CSV."""
@@ -469,7 +451,6 @@ class TaxsimValidator(BaseValidator):
                 error=f"Variable '{variable}' not supported by TAXSIM",
             )
 
-        input_file = None
         try:
             taxsim_input = self._build_taxsim_input(test_case, year)
 
@@ -478,8 +459,7 @@ class TaxsimValidator(BaseValidator):
                 csv_data = self._create_csv_string(taxsim_input)
                 output = self._execute_web(csv_data)
             else:  # local mode
-                input_file = self._create_input_csv(taxsim_input)
-                output = self._execute_local(input_file)
+                output = self._execute_local(self._create_local_csv([taxsim_input]))
 
             calculated = self._parse_output(output, variable)
 
@@ -513,17 +493,15 @@ class TaxsimValidator(BaseValidator):
                 calculated_value=None,
                 error=f"TAXSIM execution failed: {e}",
             )
-        finally:
-            if input_file and os.path.exists(input_file):
-                os.unlink(input_file)
 
     def batch_validate(
         self, test_cases: list[TestCase], variable: str, year: int = 2023
     ) -> list[ValidatorResult]:
         """Validate multiple test cases efficiently.
 
-        For web API mode, batches requests to minimize API calls.
-        TAXSIM can handle up to ~2000 records per request.
+        All cases go to TAXSIM as one multi-record input: a single web API
+        request, or a single run of the local executable. TAXSIM can handle
+        up to ~2000 records per web request.
 
         Args:
             test_cases: List of test cases to validate
@@ -560,11 +538,6 @@ class TaxsimValidator(BaseValidator):
                 for _ in test_cases
             ]
 
-        # For local mode, use sequential execution
-        if self.mode == "local":
-            return super().batch_validate(test_cases, variable, year)
-
-        # For web mode, batch the request
         try:
             # Build all inputs
             taxsim_inputs = []
@@ -573,16 +546,19 @@ class TaxsimValidator(BaseValidator):
                 ti["taxsimid"] = i  # Use index as ID
                 taxsim_inputs.append(ti)
 
-            # Create combined CSV
-            output_buf = io.StringIO()
-            writer = csv.writer(output_buf)
-            writer.writerow(TAXSIM_COLUMNS)
-            for ti in taxsim_inputs:
-                row = [ti.get(col, 0) for col in TAXSIM_COLUMNS]
-                writer.writerow(row)
+            if self.mode == "web":
+                # Create combined CSV
+                output_buf = io.StringIO()
+                writer = csv.writer(output_buf)
+                writer.writerow(TAXSIM_COLUMNS)
+                writer.writerows(
+                    [ti.get(col, 0) for col in TAXSIM_COLUMNS] for ti in taxsim_inputs
+                )
 
-            csv_data = output_buf.getvalue()
-            output = self._execute_web(csv_data)
+                csv_data = output_buf.getvalue()
+                output = self._execute_web(csv_data)
+            else:  # local mode: one executable run for the whole batch
+                output = self._execute_local(self._create_local_csv(taxsim_inputs))
 
             # Parse batch output
             lines = output.strip().split("\n")
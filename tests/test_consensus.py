@@ -82,6 +82,26 @@ class TestConsensusEngine:
         assert result.consensus_value == 600
         assert result.reward_signal > 0.4
 
+    def test_majority_agreement(self, simple_test_case):
+        """Largest cluster of nearby values wins when it is a majority."""
+        validators = [
+            MockValidator("V1", ValidatorType.REFERENCE, 500),
+            MockValidator("V2", ValidatorType.REFERENCE, 510),
+            MockValidator("V3", ValidatorType.REFERENCE, 520),
+            MockValidator("V4", ValidatorType.REFERENCE, 900),
+        ]
+        engine = ConsensusEngine(validators, tolerance=15.0)
+        result = engine.validate(simple_test_case, "eitc", 2024)
+
+        # 520 is within $15 of 510 but not of the cluster seed 500
+        assert result.consensus_level == ConsensusLevel.DISAGREEMENT
+
+        validators.append(MockValidator("V5", ValidatorType.REFERENCE, 505))
+        result = engine.validate(simple_test_case, "eitc", 2024)
+
+        assert result.consensus_level == ConsensusLevel.MAJORITY_AGREEMENT
+        assert result.consensus_value == pytest.approx(505)  # mean of 500, 510, 505
+
     def test_disagreement(self, simple_test_case):
         """No consensus when validators wildly disagree."""
         validators = [
@@ -160,6 +180,33 @@ class TestConsensusEngine:
         for r in results:
             assert r.consensus_value is not None
 
+    def test_batch_validate_matches_validate(self, simple_test_case):
+        """Batch results equal per-case validate(), one batch call per validator."""
+
+        class BatchCountingValidator(MockValidator):
+            batch_calls = 0
+
+            def batch_validate(self, test_cases, variable, year=2024):
+                self.batch_calls += 1
+                return super().batch_validate(test_cases, variable, year)
+
+        validators = [
+            BatchCountingValidator("Primary", ValidatorType.PRIMARY, 600),
+            BatchCountingValidator("V2", ValidatorType.REFERENCE, 605),
+            BatchCountingValidator("V3", ValidatorType.REFERENCE, 800),
+        ]
+        engine = ConsensusEngine(validators, tolerance=15.0)
+        other_case = TestCase(name="Other", inputs={}, expected={"eitc": 800})
+
+        results = engine.batch_validate([simple_test_case, other_case], "eitc", 2024)
+
+        assert [v.batch_calls for v in validators] == [1, 1, 1]
+        for tc, result in zip([simple_test_case, other_case], results):
+            single = engine.validate(tc, "eitc", 2024)
+            assert result.consensus_level == single.consensus_level
+            assert result.consensus_value == single.consensus_value
+            assert result.reward_signal == single.reward_signal
+
 
 class TestValidationResult:
     def test_matches_expected_within_tolerance(self, simple_test_case):
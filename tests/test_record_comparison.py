@@ -82,6 +82,147 @@ class TestRecordComparison:
         assert worst["difference"] == 700.0
 
 
+class TestRecordComparisonStats:
+    """Test weighted stats on multi-model RecordComparison."""
+
+    def _make(self):
+        from cosilico_validators.comparison.record_comparison import RecordComparison
+
+        return RecordComparison(
+            variable="eitc",
+            n_records=4,
+            cosilico=np.array([100.0, 200.0, 300.0, 400.0]),
+            policyengine=np.array([100.0, 200.0, 350.0, 400.0]),
+            taxsim=np.array([100.0, 0.0, 350.0, 400.0]),
+            taxcalc=np.zeros(4),
+            weights=np.array([1.0, 2.0, 3.0, 4.0]),
+            cosilico_ms=0.0,
+            policyengine_ms=0.0,
+            taxsim_ms=0.0,
+            taxcalc_ms=0.0,
+        )
+
+    def test_weighted_totals(self):
+        """Weighted totals should be sum(values * weights) per model."""
+        comp = self._make()
+
+        totals = comp.weighted_totals
+
+        assert totals["cosilico"] == pytest.approx(3000.0)
+        assert totals["policyengine"] == pytest.approx(3150.0)
+        assert totals["taxcalc"] == 0.0
+
+    def test_mean_abs_diff_and_match_rate(self):
+        """MAE and match rate vs PE should be weighted by record weight."""
+        comp = self._make()
+
+        assert comp.mean_abs_diff_vs_pe["cosilico"] == pytest.approx(15.0)  # 50*3/10
+        assert comp.mean_abs_diff_vs_pe["taxsim"] == pytest.approx(40.0)  # 200*2/10
+        assert comp.match_rate_vs_pe()["cosilico"] == pytest.approx(0.7)
+        assert comp.match_rate_vs_pe()["taxsim"] == pytest.approx(0.8)
+
+    def test_match_rate_respects_tolerance(self):
+        """A wider tolerance should count more records as matching."""
+        comp = self._make()
+
+        assert comp.match_rate_vs_pe(tolerance=50.0)["cosilico"] == pytest.approx(1.0)
+        assert comp.match_rate_vs_pe(tolerance=50.0)["taxsim"] == pytest.approx(0.8)
+
+    def test_stats_matches_properties(self):
+        """Single-pass stats() should agree with the legacy properties."""
+        comp = self._make()
+
+        stats = comp.stats()
+
+        assert stats["weighted_totals"] == comp.weighted_totals
+        assert stats["mean_abs_diff_vs_pe"] == comp.mean_abs_diff_vs_pe
+        assert stats["match_rate_vs_pe"] == comp.match_rate_vs_pe()
+
+
+class TestPESituationBatching:
+    """Test merging per-unit PolicyEngine situations into one batch."""
+
+    ROWS = [
+        {"is_joint": True, "num_dependents": 1, "head_age": 35, "spouse_age": 33,
+         "wage_income": 40000.0, "num_eitc_children": 1, "num_ctc_children": 1},
+        {"is_joint": False, "num_dependents": 0, "head_age": 50, "wage_income": 25000.0},
+    ]
+
+    def _situations(self):
+        from cosilico_validators.comparison.record_comparison import _create_pe_situation
+
+        return [_create_pe_situation(row, 2024) for row in self.ROWS]
+
+    def test_every_group_entity_is_per_unit(self):
+        """Entities a unit leaves out (e.g. marital_units) get one group per unit."""
+        from cosilico_validators.comparison.pe_situations import (
+            PE_GROUP_ENTITIES,
+            combine_pe_situations,
+        )
+
+        situations = self._situations()
+        combined, primary_idx = combine_pe_situations(situations)
+
+        assert "marital_units" not in situations[0]
+        assert primary_idx == [0, 3]
+        for entity in PE_GROUP_ENTITIES:
+            groups = list(combined[entity].values())
+            assert len(groups) == 2
+            assert [m.rsplit("_", 1)[1] for m in groups[0]["members"]] == ["0"] * 3
+            assert groups[1]["members"] == ["head_1"]
+
+    def test_batched_run_matches_per_unit_runs(self):
+        """A multi-unit Simulation gives the same outputs as one per unit."""
+        pytest.importorskip("policyengine_us")
+        import pandas as pd
+
+        from cosilico_validators.comparison.record_comparison import _run_pe_batch
+
+        situations = self._situations()
+        batched = _run_pe_batch((situations, 2024))
+        per_unit = pd.concat(
+            [_run_pe_batch(([situation], 2024)) for situation in situations],
+            ignore_index=True,
+        )
+
+        pd.testing.assert_frame_equal(batched, per_unit)
+
+
+class TestTaxsimInputPump:
+    """Test streaming TAXSIM input from the writer thread."""
+
+    def test_writes_csv_and_closes_stdin(self):
+        """All rows are written in chunks and stdin is closed."""
+        import io
+
+        import pandas as pd
+
+        from cosilico_validators.comparison.record_comparison import _pump_taxsim_input
+
+        stdin = MagicMock(wraps=io.BytesIO())
+        errors = []
+        _pump_taxsim_input(stdin, pd.DataFrame({"a": [1.0, 2.0, 3.0]}), errors, chunk_rows=2)
+
+        written = b"".join(call.args[0] for call in stdin.write.call_args_list)
+        assert written == b"a\n1.00\n2.00\n3.00\n"
+        stdin.close.assert_called_once()
+        assert errors == []
+
+    def test_failure_is_recorded_and_stdin_closed(self):
+        """A write failure is handed to the caller and TAXSIM still sees EOF."""
+        import pandas as pd
+
+        from cosilico_validators.comparison.record_comparison import _pump_taxsim_input
+
+        stdin = MagicMock()
+        stdin.write.side_effect = OSError("disk on fire")
+        errors = []
+        _pump_taxsim_input(stdin, pd.DataFrame({"a": [1.0]}), errors)
+
+        stdin.close.assert_called_once()
+        assert [str(e) for e in errors] == ["disk on fire"]
+
+
 class TestCPSComparison:
     """Test running comparison on actual CPS data."""
 
@@ -142,6 +283,22 @@ class TestCPSComparison:
                 assert result["match_rate"] == 1.0
                 assert result["matched_records"] == 3
 
+    def test_full_comparison_shares_one_simulation(self):
+        """Concurrent variable comparisons should reuse one Microsimulation."""
+        from cosilico_validators.comparison import run_full_comparison
+
+        with (
+            patch("cosilico_validators.comparison.core.HAS_POLICYENGINE", True),
+            patch("cosilico_validators.comparison.core.Microsimulation") as mock_sim,
+            patch("cosilico_validators.comparison.core.load_cosilico_values") as mock_cos,
+        ):
+            mock_sim.return_value.calculate.return_value = np.array([1, 2, 3])
+            mock_cos.return_value = (np.array([1.0, 2.0, 3.0]), np.array([1, 2, 3]))
+
+            run_full_comparison(["eitc", "income_tax", "adjusted_gross_income"], year=2024)
+
+            assert mock_sim.call_count == 1
+
 
 class TestComparisonDashboard:
     """Test dashboard output format."""
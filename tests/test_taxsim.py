@@ -1,5 +1,7 @@
 """Tests for TAXSIM validator."""
 
+import sys
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -305,6 +307,31 @@ class TestTaxsimValidatorValidate:
         assert result.error is not None
         assert "not supported" in result.error
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the executable")
+    def test_local_batch_runs_executable_once(self, tmp_path):
+        """Local batch mode sends every case to a single TAXSIM run."""
+        calls = tmp_path / "calls"
+        fake_taxsim = tmp_path / "taxsim35-unix.exe"
+        fake_taxsim.write_text(
+            f"#!{sys.executable}\n"
+            "import csv, sys\n"
+            f"open({str(calls)!r}, 'a').write('x')\n"
+            "print('taxsimid,v25')\n"
+            "for row in csv.DictReader(sys.stdin):\n"
+            "    print(f\"{row['taxsimid']},{float(row['pwages']) / 10}\")\n"
+        )
+        fake_taxsim.chmod(0o755)
+
+        validator = TaxsimValidator(mode="local", taxsim_path=fake_taxsim)
+        test_cases = [
+            TestCase(name=f"Case {i}", inputs={"earned_income": income}, expected={})
+            for i, income in enumerate([10000, 20000, 30000])
+        ]
+        results = validator.batch_validate(test_cases, "eitc", year=2023)
+
+        assert [r.calculated_value for r in results] == [1000.0, 2000.0, 3000.0]
+        assert calls.read_text() == "x"
+
 
 class TestTaxsimValidatorIntegration:
     """Integration tests for TAXSIM validator (require network access)."""